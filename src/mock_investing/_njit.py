@@ -0,0 +1,21 @@
+# src/mock_investing/_njit.py
+"""
+numba.njit 래퍼 모듈.
+numba가 설치되어 있지 않으면 아무 일도 하지 않는 데코레이터로 대체합니다.
+"""
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # numba 미설치 환경: 순수 파이썬으로 실행
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """numba가 없을 때 함수를 그대로 돌려주는 데코레이터."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
@@ -0,0 +1,115 @@
+# src/mock_investing/_sim_numba.py
+"""
+백테스팅 체결 루프를 numba로 컴파일하는 모듈.
+NumPy 배열과 숫자만 주고받으며, Trade 객체는 호출하는 쪽(main.py)에서 만듭니다.
+numba가 없으면 같은 코드가 순수 파이썬으로 실행됩니다.
+"""
+
+from ._njit import njit
+
+
+@njit(cache=True, error_model="numpy")
+def _simulate(closes, opens, signals, initial_cash, fee_rate, cooldown_ms,
+              order_ratio, slippage, min_cash,
+              out_ts, out_side, out_price, out_qty, out_fee, out_signal_idx,
+              portfolio_values):
+    """
+    Next Open 체결 + 슬리피지 규칙으로 전체 구간을 시뮬레이션한다.
+    i일 종가의 신호는 i+1일 시가로 체결되며, 규칙은 execute_market과 같다.
+
+    Args:
+        closes: 종가 배열
+        opens: 시가 배열
+        signals: 신호 배열 (1 = BUY, -1 = SELL, 0 = KEEP)
+        initial_cash: 초기 현금
+        fee_rate: 수수료율
+        cooldown_ms: 쿨다운 기준값 (마지막 체결 이후 경과 봉 수와 비교)
+        order_ratio: 1회 매수 시 사용할 현금 비율
+        slippage: 슬리피지 비율 (매수 +, 매도 -)
+        min_cash: 매수에 필요한 최소 현금
+        out_ts, out_side, out_price, out_qty, out_fee: 체결 내역을 채울 배열
+        out_signal_idx: 각 체결의 신호 발생 시점을 채울 배열
+        portfolio_values: 시점별 총자산을 채울 배열
+
+    Returns:
+        (현금, 보유 수량, 최근 가격, 마지막 체결 시점, 체결 건수,
+         BUY 신호 수, SELL 신호 수, 쿨다운 차단 수, 자산 없음 차단 수, 현금 부족 차단 수)
+    """
+    n_bars = closes.shape[0]
+    cash = initial_cash
+    qty = 0.0
+    last_price = 0.0
+    last_trade_ts = 0
+
+    n = 0
+    buy_signals = 0
+    sell_signals = 0
+    blocked_by_cooldown = 0
+    blocked_by_no_asset = 0
+    blocked_by_no_cash = 0
+    pending = 0  # 예약된 신호 (0 = 없음)
+    pending_idx = 0
+
+    for idx in range(n_bars):
+        # 현재가 업데이트 (종가 기준)
+        last_price = closes[idx]
+        portfolio_values[idx] = cash + qty * last_price
+
+        # 1. 이전에 발생한 신호가 있으면 오늘 시가로 체결
+        if pending != 0:
+            if pending == 1:
+                price = opens[idx] * (1 + slippage)
+                cash_to_use = min(cash * order_ratio, cash)
+                trade_qty = cash_to_use / price
+                fee = price * trade_qty * fee_rate
+                cash = cash - cash_to_use - fee
+                qty = qty + trade_qty
+                out_side[n] = 0  # Side.BUY
+            else:
+                price = opens[idx] * (1 - slippage)
+                trade_qty = qty
+                cash_gain = price * trade_qty
+                fee = cash_gain * fee_rate
+                cash = cash + cash_gain - fee
+                qty = 0.0
+                out_side[n] = 1  # Side.SELL
+
+            last_price = price
+            last_trade_ts = idx
+            out_ts[n] = idx
+            out_price[n] = price
+            out_qty[n] = trade_qty
+            out_fee[n] = fee
+            out_signal_idx[n] = pending_idx
+            n += 1
+            pending = 0
+
+        # 2. 오늘 종가 기준 신호 확인
+        sig = signals[idx]
+        if sig == 0:
+            continue
+        if sig == 1:
+            buy_signals += 1
+        else:
+            sell_signals += 1
+
+        # 마지막 날은 체결 불가 (다음날이 없음)
+        if idx >= n_bars - 1:
+            continue
+        if idx - last_trade_ts < cooldown_ms:
+            blocked_by_cooldown += 1
+            continue
+        if sig == -1 and qty == 0:
+            blocked_by_no_asset += 1
+            continue
+        if sig == 1 and cash < min_cash:
+            blocked_by_no_cash += 1
+            continue
+
+        # 신호 저장 (다음날 체결 예약)
+        pending = sig
+        pending_idx = idx
+
+    return (cash, qty, last_price, last_trade_ts, n,
+            buy_signals, sell_signals,
+            blocked_by_cooldown, blocked_by_no_asset, blocked_by_no_cash)
@@ -4,11 +4,11 @@
 입출금, 계좌 조회, 거래 내역 관리 등을 제공합니다.
 """
 
-import os
-import json
+import atexit
 from pathlib import Path
 from typing import Optional
 from .models import Portfolio
+from . import jsonio
 
 
 # 계좌 데이터 저장 경로
@@ -18,17 +18,43 @@ from .models import Portfolio
 # parents[2] -> mock-investing/ (프로젝트 루트)
 ASSETS_DIR = Path(__file__).resolve().parents[2] / "assets"
 ACCOUNT_FILE = ASSETS_DIR / "account.json"
+# 저장 폴더는 모듈을 불러올 때 한 번만 만든다
+ASSETS_DIR.mkdir(parents=True, exist_ok=True)
+
+# 종료 시 저장할 계좌 관리자 (가장 최근에 만든 인스턴스 하나만 보관)
+_active_manager: Optional["AccountManager"] = None
+
+
+def _flush_active_manager() -> None:
+    """프로그램 종료 시 최근 계좌 관리자의 변경 사항을 저장한다."""
+    if _active_manager is not None:
+        _active_manager.flush()
+
+
+atexit.register(_flush_active_manager)
 
 
 class AccountManager:
     """계좌 관리 클래스"""
     
     def __init__(self):
+        # 계좌 정보는 한 번만 읽고 메모리에서 갱신한다 (flush 시 저장)
+        self._account: dict = {}
+        self._dirty = False
+        # 종료 훅은 모듈에 하나만 둔다: 이전 인스턴스의 변경 사항은 지금 저장해 새 인스턴스가 읽게 하고,
+        # 종료 시에는 새 인스턴스만 저장해 오래된 값이 최신 잔액을 덮어쓰지 않게 한다
+        global _active_manager
+        if _active_manager is not None:
+            _active_manager.flush()
+        _active_manager = self
         self.ensure_account_file()
     
     def ensure_account_file(self) -> None:
-        """계좌 파일이 없으면 생성한다."""
-        if not os.path.exists(ACCOUNT_FILE):
+        """계좌 파일을 읽어 온다. 파일이 없으면 기본 계좌로 생성한다."""
+        # 존재 여부를 먼저 확인하지 않고 바로 읽는다 (stat 호출 및 경쟁 상태 방지)
+        try:
+            self._account = jsonio.loads(ACCOUNT_FILE.read_bytes())
+        except FileNotFoundError:
             default_account = {
                 "cash": 1000000.0,
                 "total_deposit": 1000000.0,
@@ -39,18 +65,25 @@ class AccountManager:
     
     def load_account(self) -> dict:
         """계좌 정보를 불러온다."""
-        with open(ACCOUNT_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return self._account.copy()
     
     def save_account(self, account: dict) -> None:
-        """계좌 정보를 저장한다."""
-        with open(ACCOUNT_FILE, "w", encoding="utf-8") as f:
-            json.dump(account, f, indent=2, ensure_ascii=False)
+        """계좌 정보를 즉시 저장한다."""
+        self._account = dict(account)
+        self._dirty = True
+        self.flush()
+    
+    def flush(self) -> None:
+        """변경된 계좌 정보가 있으면 파일에 저장한다."""
+        if not self._dirty:
+            return
+        
+        jsonio.atomic_write_bytes(ACCOUNT_FILE, jsonio.dumps(self._account))
+        self._dirty = False
     
     def get_balance(self) -> float:
-        """현재 잔액을 조회한다."""
-        account = self.load_account()
-        return account["cash"]
+        """현재 잔액을 조회한다 (메모리 값, 파일을 읽지 않음)."""
+        return self._account["cash"]
     
     def deposit(self, amount: float) -> bool:
         """
@@ -65,10 +98,9 @@ class AccountManager:
         if amount <= 0:
             return False
         
-        account = self.load_account()
-        account["cash"] += amount
-        account["total_deposit"] += amount
-        self.save_account(account)
+        self._account["cash"] += amount
+        self._account["total_deposit"] += amount
+        self._dirty = True
         
         return True
     
@@ -85,14 +117,12 @@ class AccountManager:
         if amount <= 0:
             return False
         
-        account = self.load_account()
-        
-        if account["cash"] < amount:
+        if self._account["cash"] < amount:
             return False  # 잔액 부족
         
-        account["cash"] -= amount
-        account["total_withdrawal"] += amount
-        self.save_account(account)
+        self._account["cash"] -= amount
+        self._account["total_withdrawal"] += amount
+        self._dirty = True
         
         return True
     
@@ -103,9 +133,8 @@ class AccountManager:
         Args:
             new_balance: 새 잔액
         """
-        account = self.load_account()
-        account["cash"] = new_balance
-        self.save_account(account)
+        self._account["cash"] = new_balance
+        self._dirty = True
     
     def get_account_summary(self) -> dict:
         """
@@ -114,7 +143,7 @@ class AccountManager:
         Returns:
             계좌 요약 딕셔너리
         """
-        account = self.load_account()
+        account = self._account
         net_deposit = account["total_deposit"] - account["total_withdrawal"]
         
         return {
@@ -181,6 +210,7 @@ def account_management_menu(account_manager: AccountManager) -> None:
         elif choice == "2":
             try:
                 amount = float(input("\n입금 금액: "))
+                # 입출금 후 잔액 조회는 메모리 값만 읽는다 (파일 I/O 없음)
                 if account_manager.deposit(amount):
                     print(f"✅ {amount:,.0f}원이 입금되었습니다.")
                     print(f"현재 잔액: {account_manager.get_balance():,.0f}원")
@@ -214,6 +244,7 @@ def account_management_menu(account_manager: AccountManager) -> None:
                     print("❌ 올바른 숫자를 입력하세요.")
         
         elif choice == "0":
+            account_manager.flush()
             break
         
         else:
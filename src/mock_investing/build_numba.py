@@ -0,0 +1,42 @@
+# src/mock_investing/build_numba.py
+"""
+백테스팅 커널 AOT(사전) 컴파일 스크립트.
+numba.pycc로 _simulate를 확장 모듈(_mock_investing_kernels)로 미리 컴파일해
+첫 실행 시 JIT 컴파일 대기를 없앱니다.
+
+사용법:
+    python -m mock_investing.build_numba
+
+컴파일된 모듈이 없으면 main.py는 _sim_numba의 JIT 버전을 그대로 사용합니다.
+"""
+
+from pathlib import Path
+from numba.pycc import CC
+from ._sim_numba import _simulate
+
+MODULE_NAME = "_mock_investing_kernels"
+
+# main.run_backtest가 넘기는 배열 dtype과 정확히 같아야 한다
+SIMULATE_SIGNATURE = (
+    "Tuple((f8, f8, f8, i8, i8, i8, i8, i8, i8, i8))("
+    "f8[:], f8[:], i1[:], f8, f8, i8, f8, f8, f8, "
+    "i8[:], i1[:], f8[:], f8[:], f8[:], i8[:], f8[:])"
+)
+
+
+def build(output_dir: Path = Path(__file__).resolve().parent) -> None:
+    """
+    커널을 확장 모듈로 컴파일해 패키지 디렉토리에 저장한다.
+
+    Args:
+        output_dir: 확장 모듈을 저장할 디렉토리
+    """
+    cc = CC(MODULE_NAME)
+    cc.output_dir = str(output_dir)
+    cc.export("simulate", SIMULATE_SIGNATURE)(_simulate.py_func)
+    cc.compile()
+    print(f"✅ {MODULE_NAME} 컴파일 완료: {output_dir}")
+
+
+if __name__ == "__main__":
+    build()
@@ -3,28 +3,39 @@
 체결(주문 실행) 로직을 처리하는 모듈.
 """
 
-from .models import Portfolio, Trade
+from typing import List, Tuple
+import numpy as np
+from ._njit import njit
+from .models import Portfolio, Trade, Side, TRADE_DTYPE
+from .feed import replay_arrays
+from .indicators import StreamingSMA
 
 
-def can_execute(now_ts: int, last_trade_ts: int, cooldown_sec: int) -> bool:
+# 배치 체결용 신호 코드 (signals 배열 값)
+SIGNAL_BUY = 1
+SIGNAL_SELL = -1
+SIGNAL_KEEP = 0
+
+
+def can_execute(now_ts: int, last_trade_ts: int, cooldown_ms: int) -> bool:
     """
-    마지막 체결 이후 cooldown_sec 초가 지났는지 확인한다.
+    마지막 체결 이후 cooldown_ms 밀리초가 지났는지 확인한다.
+    반복문에서는 호출 비용을 줄이기 위해 같은 비교식을 직접 쓴다.
     
     Args:
         now_ts: 현재 시각(밀리초)
         last_trade_ts: 마지막 체결 시각(밀리초)
-        cooldown_sec: 쿨다운 시간(초)
+        cooldown_ms: 쿨다운 시간(밀리초, cooldown_sec * 1000)
         
     Returns:
         체결 가능 여부
     """
-    diff_ms = now_ts - last_trade_ts
-    return diff_ms >= cooldown_sec * 1000
+    return now_ts - last_trade_ts >= cooldown_ms
 
 
 def execute_market(
     pf: Portfolio,
-    side: str,
+    side: int,
     price: float,
     now_ts: int,
     fee_rate: float,
@@ -36,7 +47,7 @@ def execute_market(
     
     Args:
         pf: 포트폴리오 객체
-        side: 매수/매도 구분 ("BUY" or "SELL")
+        side: 매수/매도 구분 (Side.BUY or Side.SELL)
         price: 체결 가격
         now_ts: 현재 시각(밀리초)
         fee_rate: 수수료율
@@ -46,24 +57,174 @@ def execute_market(
     Returns:
         체결된 Trade 객체
     """
-    if side == "BUY":
+    if side == Side.BUY:
         cash_to_use = min(order_cash, pf.cash)
         qty = cash_to_use / price
         fee = price * qty * fee_rate
         pf.cash = pf.cash - cash_to_use - fee
         pf.asset_qty = pf.asset_qty + qty
-    elif side == "SELL":
+    elif side == Side.SELL:
         qty = pf.asset_qty
         cash_gain = price * qty
         fee = cash_gain * fee_rate
         pf.cash = pf.cash + cash_gain - fee
         pf.asset_qty = 0.0
     else:
-        raise ValueError("side must be BUY or SELL")
+        raise ValueError("side must be Side.BUY or Side.SELL")
     
     pf.last_price = price
     pf.last_trade_ts = now_ts
     
-    return Trade(now_ts, side, price, qty, fee, rule_name)
+    return Trade(now_ts, Side(side), price, qty, fee, rule_name)
+
+
+def run_replay(
+    path: str,
+    cash: float,
+    fast: int = 5,
+    slow: int = 20,
+    fee_rate: float = 0.0005,
+    order_ratio: float = 0.3,
+    cooldown_sec: int = 0,
+) -> Tuple[Portfolio, List[Trade]]:
+    """
+    CSV 틱 데이터를 재생하며 SMA 크로스오버 규칙으로 모의 체결한다.
+    지표는 틱마다 O(1)로 갱신한다.
+    
+    Args:
+        path: 틱 CSV 파일 경로 (ts, price 컬럼)
+        cash: 초기 현금
+        fast: 빠른 이동평균 기간
+        slow: 느린 이동평균 기간
+        fee_rate: 수수료율
+        order_ratio: 1회 매수 시 사용할 현금 비율
+        cooldown_sec: 쿨다운 시간(초)
+        
+    Returns:
+        (최종 포트폴리오, 체결된 Trade 리스트)
+    """
+    pf = Portfolio(cash)
+    fast_sma = StreamingSMA(fast)
+    slow_sma = StreamingSMA(slow)
+    rule_name = f"SMA({fast}/{slow})"
+    trades: List[Trade] = []
+    cooldown_ms = cooldown_sec * 1000  # 루프 밖에서 한 번만 계산
+    
+    for ts_arr, price_arr in replay_arrays(path):
+        # tolist()로 한 번에 파이썬 숫자로 변환 (원소별 NumPy 스칼라 생성 방지)
+        for now_ts, price in zip(ts_arr.tolist(), price_arr.tolist()):
+            pf.last_price = price
+            
+            fast_now = fast_sma.update(price)
+            slow_now = slow_sma.update(price)
+            if fast_now is None or slow_now is None:
+                continue
+            
+            # fast > slow 이면 BUY, fast < slow 이면 SELL
+            if fast_now > slow_now:
+                side = Side.BUY
+            elif fast_now < slow_now:
+                side = Side.SELL
+            else:
+                continue
+            
+            # 쿨다운 체크 (can_execute 인라인)
+            if now_ts - pf.last_trade_ts < cooldown_ms:
+                continue
+            if side == Side.SELL and pf.asset_qty == 0:
+                continue
+            if side == Side.BUY and pf.cash < 1000:
+                continue
+            
+            trade = execute_market(
+                pf, side, price, now_ts, fee_rate, pf.cash * order_ratio, rule_name
+            )
+            trades.append(trade)
+    
+    return pf, trades
 
 
+@njit(cache=True)
+def _execute_batch_nb(prices, signals, fee_rate, order_ratio, cash, min_cash,
+                      out_ts, out_side, out_price, out_qty, out_fee):
+    """execute_batch의 순차 체결 루프 (numba 컴파일 대상)."""
+    qty = 0.0
+    n = 0
+    for i in range(prices.shape[0]):
+        sig = signals[i]
+        price = prices[i]
+        if sig == 1:
+            if cash < min_cash:
+                continue
+            cash_to_use = min(cash * order_ratio, cash)
+            buy_qty = cash_to_use / price
+            fee = price * buy_qty * fee_rate
+            cash = cash - cash_to_use - fee
+            qty = qty + buy_qty
+            out_qty[n] = buy_qty
+            out_side[n] = 0  # Side.BUY
+        elif sig == -1:
+            if qty == 0.0:
+                continue
+            cash_gain = price * qty
+            fee = cash_gain * fee_rate
+            cash = cash + cash_gain - fee
+            out_qty[n] = qty
+            out_side[n] = 1  # Side.SELL
+            qty = 0.0
+        else:
+            continue
+        out_ts[n] = i
+        out_price[n] = price
+        out_fee[n] = fee
+        n += 1
+    return cash, qty, n
+
+
+def execute_batch(
+    prices: np.ndarray,
+    signals: np.ndarray,
+    fee_rate: float,
+    order_ratio: float,
+    init_cash: float,
+    min_cash: float = 1000.0,
+) -> Tuple[float, float, np.ndarray]:
+    """
+    미리 계산된 신호 배열로 전체 구간을 한 번에 체결한다.
+    execute_market과 같은 규칙(매수: 현금의 order_ratio, 매도: 전량)을 따른다.
+    
+    Args:
+        prices: 체결 가격 배열
+        signals: 신호 배열 (SIGNAL_BUY / SIGNAL_SELL / SIGNAL_KEEP)
+        fee_rate: 수수료율
+        order_ratio: 1회 매수 시 사용할 현금 비율
+        init_cash: 초기 현금
+        min_cash: 매수에 필요한 최소 현금
+        
+    Returns:
+        (최종 현금, 최종 보유 수량, TRADE_DTYPE 구조화 배열)
+    """
+    prices = np.ascontiguousarray(prices, dtype=np.float64)
+    signals = np.ascontiguousarray(signals, dtype=np.int8)
+    n_max = prices.shape[0]
+    
+    out_ts = np.empty(n_max, dtype=np.int64)
+    out_side = np.empty(n_max, dtype=np.int8)
+    out_price = np.empty(n_max, dtype=np.float64)
+    out_qty = np.empty(n_max, dtype=np.float64)
+    out_fee = np.empty(n_max, dtype=np.float64)
+    
+    cash, qty, n = _execute_batch_nb(
+        prices, signals, float(fee_rate), float(order_ratio), float(init_cash),
+        float(min_cash), out_ts, out_side, out_price, out_qty, out_fee,
+    )
+    
+    # 체결 건수를 알게 된 뒤 한 번만 구조화 배열을 만든다 (JSON 변환은 tolist() 한 번)
+    trades = np.empty(n, dtype=TRADE_DTYPE)
+    trades["ts"] = out_ts[:n]
+    trades["side"] = out_side[:n]
+    trades["price"] = out_price[:n]
+    trades["qty"] = out_qty[:n]
+    trades["fee"] = out_fee[:n]
+    
+    return cash, qty, trades
@@ -5,23 +5,103 @@
 """
 
 import csv
-from typing import Iterator, Dict
+from typing import Iterator, Dict, Tuple
+import numpy as np
+import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pv
+except ImportError:  # pyarrow가 설치되지 않은 환경
+    pa = None
+    pv = None
 
-def replay_from_csv(path: str) -> Iterator[Dict[str, str]]:
+
+def replay_arrays(path: str, chunksize: int = 65536) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
     """
-    CSV 파일을 한 줄씩 읽어 tick 딕셔너리로 반환한다.
+    CSV 파일을 청크 단위로 읽어 (ts 배열, price 배열)로 반환한다.
     
     Args:
         path: CSV 파일 경로
+        chunksize: 한 번에 읽을 행 수
         
     Yields:
-        각 행의 데이터를 담은 딕셔너리 (ts, price)
+        (ts int64 배열, price float64 배열)
+    """
+    reader = pd.read_csv(
+        path,
+        usecols=["ts", "price"],
+        dtype={"ts": "int64", "price": "float64"},
+        chunksize=chunksize,
+    )
+    with reader:
+        for chunk in reader:
+            yield chunk["ts"].to_numpy(), chunk["price"].to_numpy()
+
+
+def load_price_arrays(path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    CSV 파일 전체를 한 번에 읽어 (ts 배열, price 배열)로 반환한다.
+    pyarrow가 있으면 pyarrow의 멀티스레드 CSV 파서를, 없으면 pandas를 사용한다.
+    
+    Args:
+        path: CSV 파일 경로
+        
+    Returns:
+        (ts int64 배열, price float64 배열)
+    """
+    if pv is not None:
+        table = pv.read_csv(
+            path,
+            convert_options=pv.ConvertOptions(
+                column_types={"ts": pa.int64(), "price": pa.float64()},
+                include_columns=["ts", "price"],
+            ),
+        )
+        return table.column("ts").to_numpy(), table.column("price").to_numpy()
+    
+    df = pd.read_csv(
+        path,
+        usecols=["ts", "price"],
+        dtype={"ts": "int64", "price": "float64"},
+        memory_map=True,
+    )
+    return df["ts"].to_numpy(), df["price"].to_numpy()
+
+
+def replay_from_csv(path: str) -> Iterator[Tuple[int, float]]:
     """
-    with open(path, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+    CSV 파일을 한 줄씩 읽어 (ts, price) 튜플로 반환한다.
+    csv.reader와 미리 찾아둔 열 위치를 사용해 행마다 딕셔너리를 만들지 않는다.
+    
+    Args:
+        path: CSV 파일 경로
+        
+    Yields:
+        (ts, price) 튜플
+    """
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        ts_idx = header.index("ts")
+        price_idx = header.index("price")
         for row in reader:
-            # ts, price 컬럼이 있다고 가정
-            yield {"ts": int(row["ts"]), "price": float(row["price"])}
+            # 빈 줄은 csv.reader가 []로 돌려주므로 건너뛴다 (DictReader와 동일)
+            if not row:
+                continue
+            yield int(row[ts_idx]), float(row[price_idx])
 
 
+def replay_dicts(path: str) -> Iterator[Dict[str, float]]:
+    """
+    CSV 파일을 한 줄씩 읽어 tick 딕셔너리로 반환한다.
+    (하위호환용: 내부적으로 replay_from_csv를 사용)
+    
+    Args:
+        path: CSV 파일 경로
+        
+    Yields:
+        각 행의 데이터를 담은 딕셔너리 (ts, price)
+    """
+    for ts, price in replay_from_csv(path):
+        yield {"ts": ts, "price": price}
@@ -4,41 +4,153 @@
 최고 수익률 전략을 추적합니다.
 """
 
-import json
+import atexit
+import heapq
 import os
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
+import numpy as np
+from . import jsonio
 
 
 # 히스토리 데이터 저장 경로
 ASSETS_DIR = Path(__file__).resolve().parents[2] / "assets"
-HISTORY_FILE = ASSETS_DIR / "backtest_history.json"
+# 한 줄에 결과 하나씩 추가하는 JSONL 로그 (추가 시 전체를 다시 쓰지 않음)
+HISTORY_FILE = ASSETS_DIR / "backtest_history.jsonl"
+# 이전 버전의 JSON 배열 파일 (처음 실행 시 JSONL로 변환)
+LEGACY_HISTORY_FILE = ASSETS_DIR / "backtest_history.json"
+# 저장 폴더는 모듈을 불러올 때 한 번만 만든다
+ASSETS_DIR.mkdir(parents=True, exist_ok=True)
+
+# 반복 출력용 행 서식 (서식 문자열을 한 번만 만들어 재사용)
+_RANK_ROW_FMT = "{:<4} {:<10} {:<20} {:<25} {:<20}".format
+_RATE_FMT = "{} {:+.2f}%".format
+_TRADE_ROW_FMT = "{:<4} {:<6} {:<12} {:>10,.0f}원 {:>8.4f} {:>8,.0f}원".format
+
+# 결과 추가용으로 열어 두는 파일 디스크립터 (모든 BacktestHistory 인스턴스가 공유)
+_append_fd: Optional[int] = None
+
+
+def _get_append_fd() -> int:
+    """히스토리 파일을 O_APPEND로 한 번만 열고 이후에는 같은 디스크립터를 반환한다."""
+    global _append_fd
+    if _append_fd is None:
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        _append_fd = os.open(HISTORY_FILE, flags, 0o644)
+        # 이전 실행이 줄 중간에 끊겼으면 새 기록이 깨진 줄에 이어 붙지 않도록 줄을 바꿔 둔다
+        size = os.fstat(_append_fd).st_size
+        if size:
+            with open(HISTORY_FILE, "rb") as f:
+                f.seek(size - 1)
+                if f.read(1) != b"\n":
+                    os.write(_append_fd, b"\n")
+    return _append_fd
+
+
+def _close_append_fd() -> None:
+    """열어 둔 디스크립터를 닫는다 (파일 교체 전, 프로그램 종료 시)."""
+    global _append_fd
+    if _append_fd is not None:
+        os.close(_append_fd)
+        _append_fd = None
+
+
+atexit.register(_close_append_fd)
+
+
+def _parse_lines(data: bytes) -> List[Dict]:
+    """JSONL 바이트를 줄마다 따로 파싱한다. 깨진 줄(중간에 끊긴 기록 등)은 건너뛴다."""
+    history = []
+    for lineno, line in enumerate(data.splitlines(), 1):
+        if not line.strip():
+            continue
+        try:
+            history.append(jsonio.loads(line))
+        except jsonio.JSONDecodeError:
+            print(f"⚠️  히스토리 {lineno}번째 줄이 손상되어 건너뜁니다.")
+    return history
+
+
+def _next_id(history: List[Dict]) -> int:
+    """다음 결과 ID (기존 최대 ID + 1, 건너뛴 줄이 있어도 ID가 겹치지 않는다)."""
+    return max((r.get('id', 0) for r in history), default=0) + 1
 
 
 class BacktestHistory:
     """백테스팅 결과 기록 관리 클래스"""
     
     def __init__(self):
+        # 파싱된 히스토리 캐시 (파일 수정 시각이 같으면 재사용)
+        self._cache: Optional[List[Dict]] = None
+        self._cache_mtime: int = 0
         self.ensure_history_file()
     
     def ensure_history_file(self) -> None:
-        """히스토리 파일이 없으면 생성한다."""
-        if not os.path.exists(HISTORY_FILE):
+        """히스토리 파일이 없으면 생성한다. 이전 JSON 파일이 있으면 변환한다."""
+        # 존재 여부를 먼저 확인하지 않고 시도한 뒤 FileNotFoundError로 분기한다
+        try:
+            HISTORY_FILE.stat()
+            return
+        except FileNotFoundError:
+            pass
+        
+        try:
+            self.migrate_legacy_history()
+        except FileNotFoundError:
+            self.save_history([])
+        except jsonio.JSONDecodeError:
+            # 손상된 이전 파일은 .bak으로 옮겨 두고 빈 히스토리로 시작한다
+            print("⚠️  이전 히스토리 파일이 손상되어 백업 후 새로 시작합니다.")
+            os.replace(LEGACY_HISTORY_FILE, LEGACY_HISTORY_FILE.with_suffix(".json.bak"))
             self.save_history([])
     
+    def migrate_legacy_history(self) -> None:
+        """이전 JSON 배열 히스토리를 JSONL 파일로 변환한다 (원본은 .bak으로 보관)."""
+        legacy = jsonio.loads(LEGACY_HISTORY_FILE.read_bytes())
+        self.save_history(legacy)
+        os.replace(LEGACY_HISTORY_FILE, LEGACY_HISTORY_FILE.with_suffix(".json.bak"))
+    
     def load_history(self) -> List[Dict]:
-        """히스토리를 불러온다."""
+        """히스토리를 불러온다 (호출자가 정렬/수정해도 캐시가 바뀌지 않도록 리스트 사본을 반환)."""
         try:
-            with open(HISTORY_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except:
+            st = HISTORY_FILE.stat()
+            if self._cache is not None and st.st_mtime_ns == self._cache_mtime:
+                return list(self._cache)
+            
+            # 빈 파일(첫 실행)은 읽거나 파싱하지 않는다
+            if st.st_size == 0:
+                self._cache = []
+            else:
+                self._cache = _parse_lines(HISTORY_FILE.read_bytes())
+            self._cache_mtime = st.st_mtime_ns
+            return list(self._cache)
+        except FileNotFoundError:
             return []
     
     def save_history(self, history: List[Dict]) -> None:
-        """히스토리를 저장한다."""
-        with open(HISTORY_FILE, "w", encoding="utf-8") as f:
-            json.dump(history, f, indent=2, ensure_ascii=False)
+        """히스토리 전체를 다시 저장한다."""
+        # 파일을 교체하면 열어 둔 디스크립터가 이전 파일을 가리키므로 먼저 닫는다
+        _close_append_fd()
+        data = b"".join(jsonio.dumps_line(result) for result in history)
+        jsonio.atomic_write_bytes(HISTORY_FILE, data)
+        # 호출자가 넘긴 리스트를 나중에 고쳐도 캐시가 바뀌지 않도록 사본을 보관한다
+        self._cache = list(history)
+        self._cache_mtime = HISTORY_FILE.stat().st_mtime_ns
+    
+    def _append_lines(self, results: List[Dict]) -> None:
+        """결과들을 파일 끝에 추가하고 캐시도 함께 갱신한다."""
+        history = self.load_history()
+        
+        # 추가할 때마다 파일을 열고 닫지 않고 공유 디스크립터에 바로 쓴다
+        fd = _get_append_fd()
+        data = memoryview(b"".join(jsonio.dumps_line(result) for result in results))
+        while data:
+            data = data[os.write(fd, data):]
+        
+        history.extend(results)
+        self._cache = history
+        self._cache_mtime = os.fstat(fd).st_mtime_ns
     
     def add_result(self, result: Dict) -> None:
         """
@@ -60,14 +172,33 @@ class BacktestHistory:
                 - trades: 거래 내역 리스트 (추가)
                 - settings: 매매 설정 (추가)
         """
-        history = self.load_history()
+        # ID는 현재 최대 ID 기준 (캐시가 있으면 파일을 다시 읽지 않음)
+        next_id = _next_id(self.load_history())
         
         # 타임스탬프 추가
         result['timestamp'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        result['id'] = len(history) + 1
+        result['id'] = next_id
         
-        history.append(result)
-        self.save_history(history)
+        self._append_lines([result])
+    
+    def add_result_batch(self, results: List[Dict]) -> None:
+        """
+        여러 백테스팅 결과를 한 번에 추가한다 (파일 끝에 한 번만 쓴다).
+        
+        Args:
+            results: 백테스팅 결과 딕셔너리 리스트 (add_result와 같은 형식)
+        """
+        if not results:
+            return
+        
+        next_id = _next_id(self.load_history())
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        for offset, result in enumerate(results):
+            result['timestamp'] = timestamp
+            result['id'] = next_id + offset
+        
+        self._append_lines(results)
     
     def get_rankings(self, limit: int = 20) -> List[Dict]:
         """
@@ -81,14 +212,12 @@ class BacktestHistory:
         """
         history = self.load_history()
         
-        # 수익률 기준 내림차순 정렬
-        sorted_history = sorted(
-            history, 
-            key=lambda x: x.get('profit_rate', -999999),
-            reverse=True
+        # 수익률 기준 상위 limit개만 추출 (전체 정렬 없이 힙 사용)
+        return heapq.nlargest(
+            limit,
+            history,
+            key=lambda x: x.get('profit_rate', -999999)
         )
-        
-        return sorted_history[:limit]
     
     def get_by_id(self, result_id: int) -> Optional[Dict]:
         """
@@ -129,15 +258,32 @@ class BacktestHistory:
                 "worst_profit_rate": 0,
             }
         
-        profit_rates = [r.get('profit_rate', 0) for r in history]
+        # 한 번의 순회로 합계/최고/최저/양수/음수 개수를 모두 계산
+        total = 0.0
+        best = float('-inf')
+        worst = float('inf')
+        positive = 0
+        negative = 0
+        
+        for r in history:
+            rate = r.get('profit_rate', 0)
+            total += rate
+            if rate > best:
+                best = rate
+            if rate < worst:
+                worst = rate
+            if rate > 0:
+                positive += 1
+            elif rate < 0:
+                negative += 1
         
         return {
             "total_tests": len(history),
-            "avg_profit_rate": sum(profit_rates) / len(profit_rates),
-            "best_profit_rate": max(profit_rates),
-            "worst_profit_rate": min(profit_rates),
-            "positive_count": sum(1 for r in profit_rates if r > 0),
-            "negative_count": sum(1 for r in profit_rates if r < 0),
+            "avg_profit_rate": total / len(history),
+            "best_profit_rate": best,
+            "worst_profit_rate": worst,
+            "positive_count": positive,
+            "negative_count": negative,
         }
 
 
@@ -166,15 +312,14 @@ def print_ranking_list(rankings: List[Dict]) -> None:
         timestamp = result.get('timestamp', 'Unknown')
         
         # 수익률 색상 (콘솔에서는 기호로 표시)
-        rate_str = f"{profit_rate:+.2f}%"
         if profit_rate > 0:
-            rate_str = f"▲ {rate_str}"
+            rate_str = _RATE_FMT("▲", profit_rate)
         elif profit_rate < 0:
-            rate_str = f"▼ {rate_str}"
+            rate_str = _RATE_FMT("▼", profit_rate)
         else:
-            rate_str = f"- {rate_str}"
+            rate_str = _RATE_FMT("-", profit_rate)
         
-        print(f"{idx:<4} {rate_str:<10} {stock_name:<20} {strategy:<25} {timestamp:<20}")
+        print(_RANK_ROW_FMT(idx, rate_str, stock_name, strategy, timestamp))
     
     print("=" * 80)
 
@@ -237,10 +382,8 @@ def print_result_detail(result: Dict) -> None:
         for idx, trade in enumerate(trades[:20], 1):  # 최대 20건만 표시
             # 날짜 정보가 있으면 사용, 없으면 인덱스 사용 (하위호환)
             date_str = trade.get('date', str(trade['ts']))
-            print(f"{idx:<4} {trade['side']:<6} {date_str:<12} "
-                  f"{float(trade['price']):>10,.0f}원 "
-                  f"{float(trade['qty']):>8.4f} "
-                  f"{float(trade['fee']):>8,.0f}원")
+            print(_TRADE_ROW_FMT(idx, trade['side'], date_str,
+                                 float(trade['price']), float(trade['qty']), float(trade['fee'])))
         
         if len(trades) > 20:
             print(f"... 외 {len(trades)-20}건")
@@ -317,7 +460,7 @@ def show_result_chart(result: Dict) -> None:
     try:
         from .market_data import download_stock_data
         from .visualization import plot_candlestick_chart, plot_backtest_results
-        from .models import Trade, Portfolio
+        from .models import Trade, Portfolio, Side
         
         ticker = result.get('ticker')
         period_map = {"1개월": "1mo", "3개월": "3mo", "6개월": "6mo", "1년": "1y"}
@@ -335,7 +478,7 @@ def show_result_chart(result: Dict) -> None:
         for t_data in result.get('trades', []):
             trade = Trade(
                 ts=t_data['ts'],
-                side=t_data['side'],
+                side=Side[t_data['side']],
                 price=t_data['price'],
                 qty=t_data['qty'],
                 fee=t_data['fee'],
@@ -346,20 +489,22 @@ def show_result_chart(result: Dict) -> None:
         # 포트폴리오 가치 재계산
         initial_cash = result.get('initial_cash', 0)
         portfolio = Portfolio(initial_cash)
-        portfolio_values = []
+        # 봉 수를 알고 있으므로 시점별 총자산 배열을 미리 잡아 둔다
+        closes = df['Close'].to_numpy(dtype=np.float64, copy=False)
+        portfolio_values = np.empty(len(closes), dtype=np.float64)
         
         # 거래 내역을 시간 순으로 정렬
         trades_sorted = sorted(trades, key=lambda t: t.ts)
         trade_idx = 0
         
-        for idx in range(len(df)):
-            price = df.iloc[idx]['Close']
+        for idx in range(len(closes)):
+            price = float(closes[idx])
             portfolio.last_price = price
             
             # 이 시점에 체결된 거래가 있으면 반영
             while trade_idx < len(trades_sorted) and trades_sorted[trade_idx].ts == idx:
                 trade = trades_sorted[trade_idx]
-                if trade.side == "BUY":
+                if trade.side == Side.BUY:
                     portfolio.cash -= (trade.price * trade.qty + trade.fee)
                     portfolio.asset_qty += trade.qty
                 else:  # SELL
@@ -367,7 +512,7 @@ def show_result_chart(result: Dict) -> None:
                     portfolio.asset_qty -= trade.qty
                 trade_idx += 1
             
-            portfolio_values.append(portfolio.equity())
+            portfolio_values[idx] = portfolio.equity()
         
         # 차트 선택
         print("\n📊 차트 선택:")
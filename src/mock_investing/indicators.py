@@ -4,16 +4,142 @@
 여러 트레이딩 지표를 제공합니다.
 """
 
-from typing import List, Optional
+import math
+from collections import deque
+from typing import Optional
+import numpy as np
 import pandas as pd
+from ._njit import HAVE_NUMBA
+from .indicators_nb import (
+    sma_nb, ema_nb, rsi_nb, macd_nb, bollinger_nb,
+    sma_series_nb, ema_series_nb, macd_series_nb, bollinger_series_nb
+)
 
 
-def compute_sma(prices: List[float], window: int) -> Optional[float]:
+# 이 길이 이상이면 numba 커널 사용 (짧은 배열은 NumPy가 충분히 빠름)
+NUMBA_MIN_LENGTH = 32
+
+
+def _as_array(prices) -> np.ndarray:
+    """가격 데이터를 float64 NumPy 배열로 변환한다 (이미 배열이면 복사하지 않음)."""
+    return np.asarray(prices, dtype=np.float64)
+
+
+def _ema_series(arr: np.ndarray, window: int) -> np.ndarray:
+    """
+    전체 구간의 EMA 시계열을 계산한다.
+    첫 EMA는 처음 window개의 SMA로 시작하며, 그 이전 구간은 NaN이다.
+    
+    Args:
+        arr: 가격 배열
+        window: 이동평균 기간
+        
+    Returns:
+        입력과 같은 길이의 EMA 배열
+    """
+    result = np.full(arr.shape[0], np.nan)
+    if arr.shape[0] < window:
+        return result
+    
+    # SMA로 시작값을 정한 뒤 adjust=False 재귀식으로 나머지를 계산
+    seeded = arr[window - 1:].copy()
+    seeded[0] = arr[:window].mean()
+    result[window - 1:] = pd.Series(seeded).ewm(span=window, adjust=False).mean().to_numpy()
+    return result
+
+
+def compute_sma_series(prices: np.ndarray, window: int) -> np.ndarray:
+    """
+    전체 구간의 SMA 시계열을 한 번에 계산한다.
+    결과[i]는 compute_sma(prices[:i+1], window)와 같으며, 값이 없는 구간은 NaN이다.
+    
+    Args:
+        prices: 가격 배열 (리스트도 허용)
+        window: 이동평균 기간
+        
+    Returns:
+        입력과 같은 길이의 SMA 배열
+    """
+    arr = _as_array(prices)
+    result = np.full(arr.shape[0], np.nan)
+    if window <= 0 or arr.shape[0] < window:
+        return result
+    
+    # compute_sma와 같은 합산 순서를 써야 두 평균이 같을 때(fast == slow) 비교 결과가 일치한다:
+    # 창 뷰의 행별 mean()은 arr[-window:].mean()과 같은 순서로 더한다
+    windows = np.lib.stride_tricks.sliding_window_view(arr, window)
+    result[window - 1:] = windows.mean(axis=-1)
+    if HAVE_NUMBA and arr.shape[0] >= NUMBA_MIN_LENGTH:
+        # compute_sma가 numba 커널로 바뀌는 길이부터는 sma_nb와 같은 순서로 다시 더한다
+        start = max(NUMBA_MIN_LENGTH, window) - 1
+        result[start:] = sma_series_nb(arr, window)[start:]
+    return result
+
+
+def compute_ema_series(prices: np.ndarray, window: int) -> np.ndarray:
+    """
+    전체 구간의 EMA 시계열을 한 번에 계산한다.
+    결과[i]는 compute_ema(prices[:i+1], window)와 같으며, 값이 없는 구간은 NaN이다.
+    
+    Args:
+        prices: 가격 배열 (리스트도 허용)
+        window: 이동평균 기간
+        
+    Returns:
+        입력과 같은 길이의 EMA 배열
+    """
+    arr = _as_array(prices)
+    result = _ema_series(arr, window)
+    if HAVE_NUMBA and arr.shape[0] >= NUMBA_MIN_LENGTH:
+        # compute_ema가 ema_nb로 바뀌는 길이부터는 같은 재귀식으로 계산한 값을 쓴다
+        start = max(NUMBA_MIN_LENGTH, window) - 1
+        result[start:] = ema_series_nb(arr, window)[start:]
+    return result
+
+
+def compute_macd_series(prices: np.ndarray,
+                        fast: int = 12,
+                        slow: int = 26,
+                        signal: int = 9) -> tuple:
+    """
+    전체 구간의 MACD선/시그널선 시계열을 한 번에 계산한다.
+    결과[i]는 compute_macd(prices[:i+1], ...)의 값과 같으며, 값이 없는 구간은 NaN이다.
+    
+    Args:
+        prices: 가격 배열 (리스트도 허용)
+        fast: 빠른 EMA 기간 (기본 12)
+        slow: 느린 EMA 기간 (기본 26)
+        signal: 시그널선 기간 (기본 9)
+        
+    Returns:
+        (MACD 배열, 시그널 배열)
+    """
+    arr = _as_array(prices)
+    macd_series = _ema_series(arr, fast) - _ema_series(arr, slow)
+    
+    # 시그널선 = slow번째 이후 MACD 값의 최근 signal개 평균
+    # (창 뷰의 행별 mean()은 compute_macd의 macd_values[-signal:].mean()과 같은 순서로 더한다)
+    signal_series = np.full(arr.shape[0], np.nan)
+    if arr.shape[0] >= slow + signal:
+        windows = np.lib.stride_tricks.sliding_window_view(macd_series[slow:], signal)
+        signal_series[slow + signal - 1:] = windows.mean(axis=-1)
+        if HAVE_NUMBA and fast <= slow and arr.shape[0] >= NUMBA_MIN_LENGTH:
+            # compute_macd가 macd_nb로 바뀌는 길이부터는 같은 순서로 계산한 값을 쓴다
+            start = max(NUMBA_MIN_LENGTH, slow + signal) - 1
+            nb_macd, nb_signal = macd_series_nb(arr, fast, slow, signal)
+            macd_series[start:] = nb_macd[start:]
+            signal_series[start:] = nb_signal[start:]
+    # 시그널선이 없는 구간은 MACD도 비교하지 않는다 (compute_macd가 None인 구간)
+    macd_series[:slow + signal - 1] = np.nan
+    return macd_series, signal_series
+
+
+def compute_sma(prices: np.ndarray, window: int) -> Optional[float]:
     """
     단순 이동평균(Simple Moving Average)을 계산한다.
     
     Args:
-        prices: 가격 리스트
+        prices: 가격 배열 (리스트도 허용)
         window: 이동평균 기간
         
     Returns:
@@ -22,20 +148,19 @@ def compute_sma(prices: List[float], window: int) -> Optional[float]:
     if len(prices) < window:
         return None
     
-    window_prices = prices[-window:]
-    total = 0.0
-    for p in window_prices:
-        total = total + p
+    arr = _as_array(prices)
+    if HAVE_NUMBA and len(arr) >= NUMBA_MIN_LENGTH:
+        return float(sma_nb(arr, window))
     
-    return total / window
+    return float(arr[-window:].mean())
 
 
-def compute_ema(prices: List[float], window: int) -> Optional[float]:
+def compute_ema(prices: np.ndarray, window: int) -> Optional[float]:
     """
     지수 이동평균(Exponential Moving Average)을 계산한다.
     
     Args:
-        prices: 가격 리스트
+        prices: 가격 배열 (리스트도 허용)
         window: 이동평균 기간
         
     Returns:
@@ -44,26 +169,20 @@ def compute_ema(prices: List[float], window: int) -> Optional[float]:
     if len(prices) < window:
         return None
     
-    # 첫 EMA는 SMA로 시작
-    if len(prices) == window:
-        return compute_sma(prices, window)
-    
-    # EMA 계산: EMA = (현재가 * 승수) + (이전 EMA * (1 - 승수))
-    multiplier = 2.0 / (window + 1)
-    ema = compute_sma(prices[:window], window)
-    
-    for price in prices[window:]:
-        ema = (price * multiplier) + (ema * (1 - multiplier))
+    arr = _as_array(prices)
+    if HAVE_NUMBA and len(arr) >= NUMBA_MIN_LENGTH:
+        return float(ema_nb(arr, window))
     
-    return ema
+    # EMA = (현재가 * 승수) + (이전 EMA * (1 - 승수)), 첫 EMA는 SMA
+    return float(_ema_series(arr, window)[-1])
 
 
-def compute_rsi(prices: List[float], window: int = 14) -> Optional[float]:
+def compute_rsi(prices: np.ndarray, window: int = 14) -> Optional[float]:
     """
     상대강도지수(Relative Strength Index)를 계산한다.
     
     Args:
-        prices: 가격 리스트
+        prices: 가격 배열 (리스트도 허용)
         window: RSI 기간 (기본 14)
         
     Returns:
@@ -72,22 +191,16 @@ def compute_rsi(prices: List[float], window: int = 14) -> Optional[float]:
     if len(prices) < window + 1:
         return None
     
-    # 가격 변화량 계산
-    gains = []
-    losses = []
+    arr = _as_array(prices)
+    if HAVE_NUMBA and len(arr) >= NUMBA_MIN_LENGTH:
+        return float(rsi_nb(arr, window))
     
-    for i in range(1, len(prices)):
-        change = prices[i] - prices[i-1]
-        if change > 0:
-            gains.append(change)
-            losses.append(0)
-        else:
-            gains.append(0)
-            losses.append(abs(change))
+    # 최근 window개의 가격 변화량
+    changes = np.diff(arr[-(window + 1):])
     
     # 최근 window개의 평균 상승/하락폭
-    avg_gain = sum(gains[-window:]) / window
-    avg_loss = sum(losses[-window:]) / window
+    avg_gain = np.where(changes > 0, changes, 0.0).sum() / window
+    avg_loss = np.where(changes < 0, -changes, 0.0).sum() / window
     
     if avg_loss == 0:
         return 100.0
@@ -95,10 +208,10 @@ def compute_rsi(prices: List[float], window: int = 14) -> Optional[float]:
     rs = avg_gain / avg_loss
     rsi = 100 - (100 / (1 + rs))
     
-    return rsi
+    return float(rsi)
 
 
-def compute_macd(prices: List[float], 
+def compute_macd(prices: np.ndarray, 
                  fast: int = 12, 
                  slow: int = 26, 
                  signal: int = 9) -> Optional[dict]:
@@ -106,7 +219,7 @@ def compute_macd(prices: List[float],
     MACD(Moving Average Convergence Divergence)를 계산한다.
     
     Args:
-        prices: 가격 리스트
+        prices: 가격 배열 (리스트도 허용)
         fast: 빠른 EMA 기간 (기본 12)
         slow: 느린 EMA 기간 (기본 26)
         signal: 시그널선 기간 (기본 9)
@@ -117,49 +230,43 @@ def compute_macd(prices: List[float],
     if len(prices) < slow + signal:
         return None
     
-    # MACD = EMA(12) - EMA(26)
-    ema_fast = compute_ema(prices, fast)
-    ema_slow = compute_ema(prices, slow)
-    
-    if ema_fast is None or ema_slow is None:
-        return None
-    
-    macd_line = ema_fast - ema_slow
+    arr = _as_array(prices)
+    if HAVE_NUMBA and fast <= slow and len(arr) >= NUMBA_MIN_LENGTH:
+        # 한 번의 순회로 EMA 두 개와 시그널 합을 갱신 (중간 배열 없음)
+        macd_line, signal_line = macd_nb(arr, fast, slow, signal)
+        return {
+            "macd": float(macd_line),
+            "signal": float(signal_line),
+            "histogram": float(macd_line - signal_line)
+        }
     
-    # 시그널선 = MACD의 EMA(9)
-    # 간단히 하기 위해 최근 값들만 사용
-    macd_values = []
-    for i in range(slow, len(prices)):
-        ema_f = compute_ema(prices[:i+1], fast)
-        ema_s = compute_ema(prices[:i+1], slow)
-        if ema_f and ema_s:
-            macd_values.append(ema_f - ema_s)
+    # MACD = EMA(12) - EMA(26), EMA 시계열은 한 번만 계산
+    macd_series = _ema_series(arr, fast) - _ema_series(arr, slow)
+    macd_line = macd_series[-1]
     
+    # 시그널선 = 최근 signal개 MACD 값의 평균
+    macd_values = macd_series[slow:]
     if len(macd_values) < signal:
         return None
     
-    signal_line = compute_sma(macd_values, signal)
-    
-    if signal_line is None:
-        return None
-    
+    signal_line = macd_values[-signal:].mean()
     histogram = macd_line - signal_line
     
     return {
-        "macd": macd_line,
-        "signal": signal_line,
-        "histogram": histogram
+        "macd": float(macd_line),
+        "signal": float(signal_line),
+        "histogram": float(histogram)
     }
 
 
-def compute_bollinger_bands(prices: List[float], 
+def compute_bollinger_bands(prices: np.ndarray, 
                             window: int = 20, 
                             num_std: float = 2.0) -> Optional[dict]:
     """
     볼린저 밴드(Bollinger Bands)를 계산한다.
     
     Args:
-        prices: 가격 리스트
+        prices: 가격 배열 (리스트도 허용)
         window: 이동평균 기간 (기본 20)
         num_std: 표준편차 배수 (기본 2)
         
@@ -169,16 +276,16 @@ def compute_bollinger_bands(prices: List[float],
     if len(prices) < window:
         return None
     
-    # 중간 밴드 = SMA
-    middle = compute_sma(prices, window)
-    
-    if middle is None:
-        return None
-    
-    # 표준편차 계산
-    window_prices = prices[-window:]
-    variance = sum((p - middle) ** 2 for p in window_prices) / window
-    std_dev = variance ** 0.5
+    arr = _as_array(prices)
+    if HAVE_NUMBA and len(arr) >= NUMBA_MIN_LENGTH:
+        # 마지막 window개만 두 번 훑어 평균/표준편차를 구한다 (중간 배열 없음)
+        middle, std_dev = bollinger_nb(arr, window)
+    else:
+        window_prices = arr[-window:]
+        
+        # 중간 밴드 = SMA, 표준편차는 모집단 기준 (ddof=0)
+        middle = float(window_prices.mean())
+        std_dev = float(window_prices.std(ddof=0))
     
     # 상단/하단 밴드
     upper = middle + (num_std * std_dev)
@@ -191,3 +298,230 @@ def compute_bollinger_bands(prices: List[float],
     }
 
 
+def compute_bollinger_series(prices: np.ndarray,
+                             window: int = 20,
+                             num_std: float = 2.0) -> tuple:
+    """
+    전체 구간의 볼린저 밴드 시계열을 한 번에 계산한다.
+    결과[i]는 compute_bollinger_bands(prices[:i+1], ...)의 값과 같으며, 값이 없는 구간은 NaN이다.
+    
+    Args:
+        prices: 가격 배열 (리스트도 허용)
+        window: 이동평균 기간 (기본 20)
+        num_std: 표준편차 배수 (기본 2)
+        
+    Returns:
+        (상단밴드 배열, 중간밴드 배열, 하단밴드 배열)
+    """
+    arr = _as_array(prices)
+    middle = np.full(arr.shape[0], np.nan)
+    std_dev = np.full(arr.shape[0], np.nan)
+    if window <= 0 or arr.shape[0] < window:
+        return middle.copy(), middle, middle.copy()
+    
+    # (N-window+1, window) 크기의 복사 없는 창 뷰에서 행마다 평균/표준편차(ddof=0)를 구한다
+    windows = np.lib.stride_tricks.sliding_window_view(arr, window)
+    middle[window - 1:] = windows.mean(axis=-1)
+    std_dev[window - 1:] = windows.std(axis=-1, ddof=0)
+    if HAVE_NUMBA and arr.shape[0] >= NUMBA_MIN_LENGTH:
+        # compute_bollinger_bands가 bollinger_nb로 바뀌는 길이부터는 같은 순서로 다시 계산한다
+        start = max(NUMBA_MIN_LENGTH, window) - 1
+        nb_middle, nb_std = bollinger_series_nb(arr, window)
+        middle[start:] = nb_middle[start:]
+        std_dev[start:] = nb_std[start:]
+    
+    band = num_std * std_dev
+    upper = middle + band
+    lower = middle - band
+    return upper, middle, lower
+
+
+class StreamingSMA:
+    """가격이 하나씩 들어올 때 O(1)로 갱신되는 단순 이동평균."""
+    
+    def __init__(self, window: int):
+        self.window = window
+        self.buf = deque(maxlen=window)
+        self.s = 0.0
+    
+    def update(self, price: float) -> Optional[float]:
+        """
+        새 가격을 반영한 SMA를 반환한다.
+        
+        Args:
+            price: 새 가격
+            
+        Returns:
+            단순 이동평균 값 또는 None (데이터 부족)
+        """
+        if len(self.buf) == self.window:
+            self.s -= self.buf[0]  # 가장 오래된 가격 제거
+        self.buf.append(price)
+        self.s += price
+        
+        if len(self.buf) < self.window:
+            return None
+        return self.s / self.window
+
+
+class StreamingEMA:
+    """가격이 하나씩 들어올 때 O(1)로 갱신되는 지수 이동평균."""
+    
+    def __init__(self, window: int):
+        self.window = window
+        self.k = 2.0 / (window + 1)
+        self.value: Optional[float] = None
+        self._seed = StreamingSMA(window)  # 첫 EMA는 SMA로 시작
+    
+    def update(self, price: float) -> Optional[float]:
+        """
+        새 가격을 반영한 EMA를 반환한다.
+        
+        Args:
+            price: 새 가격
+            
+        Returns:
+            지수 이동평균 값 또는 None (데이터 부족)
+        """
+        if self.value is None:
+            self.value = self._seed.update(price)
+        else:
+            self.value = price * self.k + self.value * (1 - self.k)
+        return self.value
+
+
+class StreamingRSI:
+    """가격이 하나씩 들어올 때 O(1)로 갱신되는 RSI (compute_rsi와 같은 단순 평균 방식)."""
+    
+    def __init__(self, window: int = 14):
+        self.window = window
+        self.gains = deque(maxlen=window)
+        self.losses = deque(maxlen=window)
+        self.gain_sum = 0.0
+        self.loss_sum = 0.0
+        self.prev_price: Optional[float] = None
+    
+    def update(self, price: float) -> Optional[float]:
+        """
+        새 가격을 반영한 RSI를 반환한다.
+        
+        Args:
+            price: 새 가격
+            
+        Returns:
+            RSI 값 (0-100) 또는 None (데이터 부족)
+        """
+        if self.prev_price is None:
+            self.prev_price = price
+            return None
+        
+        change = price - self.prev_price
+        self.prev_price = price
+        
+        # 구간에서 빠지는 변화량 제거
+        if len(self.gains) == self.window:
+            self.gain_sum -= self.gains[0]
+            self.loss_sum -= self.losses[0]
+        
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        self.gains.append(gain)
+        self.losses.append(loss)
+        self.gain_sum += gain
+        self.loss_sum += loss
+        
+        if len(self.gains) < self.window:
+            return None
+        
+        if self.loss_sum <= 0:
+            return 100.0
+        
+        rs = self.gain_sum / self.loss_sum
+        return 100 - (100 / (1 + rs))
+
+
+class StreamingBollinger:
+    """가격이 하나씩 들어올 때 O(1)로 갱신되는 볼린저 밴드 (모집단 표준편차, ddof=0)."""
+    
+    def __init__(self, window: int = 20, num_std: float = 2.0):
+        self.window = window
+        self.num_std = num_std
+        # 고정 크기 float64 링 버퍼: cur 자리에 가장 오래된 가격이 있다
+        self.buf = np.zeros(window, dtype=np.float64)
+        self.cur = 0
+        self.filled = 0
+        self.s = 0.0
+        self.sq = 0.0
+    
+    def update(self, price: float) -> Optional[dict]:
+        """
+        새 가격을 반영한 볼린저 밴드를 반환한다.
+        
+        Args:
+            price: 새 가격
+            
+        Returns:
+            {"upper": 상단밴드, "middle": 중간밴드, "lower": 하단밴드} 또는 None (데이터 부족)
+        """
+        price = float(price)
+        # 구간에서 빠지는 가격을 합과 제곱합에서 제거 (버퍼가 차기 전에는 0)
+        old = float(self.buf[self.cur])
+        self.buf[self.cur] = price
+        self.cur = (self.cur + 1) % self.window
+        self.s += price - old
+        self.sq += price * price - old * old
+        
+        if self.filled < self.window:
+            self.filled += 1
+            if self.filled < self.window:
+                return None
+        
+        middle = self.s / self.window
+        # 반올림 오차로 분산이 아주 작은 음수가 될 수 있으므로 0으로 자른다
+        variance = max(self.sq / self.window - middle * middle, 0.0)
+        band = self.num_std * math.sqrt(variance)
+        return {
+            "upper": middle + band,
+            "middle": middle,
+            "lower": middle - band
+        }
+
+
+class StreamingMACD:
+    """가격이 하나씩 들어올 때 O(1)로 갱신되는 MACD (compute_macd와 같은 SMA 시그널선 방식)."""
+    
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.slow = slow
+        self.count = 0
+        self._fast = StreamingEMA(fast)
+        self._slow = StreamingEMA(slow)
+        self._signal = StreamingSMA(signal)  # 시그널선 = 최근 signal개 MACD 평균
+    
+    def update(self, price: float) -> Optional[dict]:
+        """
+        새 가격을 반영한 MACD를 반환한다.
+        
+        Args:
+            price: 새 가격
+            
+        Returns:
+            {"macd": MACD값, "signal": 시그널값, "histogram": 히스토그램값} 또는 None (데이터 부족)
+        """
+        self.count += 1
+        ema_fast = self._fast.update(price)
+        ema_slow = self._slow.update(price)
+        
+        # compute_macd처럼 slow번째 이후의 MACD 값만 시그널선에 반영
+        if ema_fast is None or ema_slow is None or self.count <= self.slow:
+            return None
+        
+        macd_line = ema_fast - ema_slow
+        signal_line = self._signal.update(macd_line)
+        if signal_line is None:
+            return None
+        
+        return {
+            "macd": macd_line,
+            "signal": signal_line,
+            "histogram": macd_line - signal_line
+        }
@@ -0,0 +1,234 @@
+# src/mock_investing/indicators_nb.py
+"""
+Numba로 컴파일되는 기술적 지표 커널 모듈.
+float64 배열을 받아 마지막 시점의 지표 값(스칼라)을 반환합니다.
+길이 검사는 호출하는 쪽(indicators.py)에서 처리합니다.
+*_signals_nb 커널은 전체 구간의 매매 신호 배열(int8)을 한 번에 만듭니다.
+"""
+
+import numpy as np
+from ._njit import njit
+
+
+@njit(cache=True)
+def sma_nb(a, w):
+    """마지막 w개 가격의 단순 이동평균."""
+    s = 0.0
+    for i in range(a.shape[0] - w, a.shape[0]):
+        s += a[i]
+    return s / w
+
+
+@njit(cache=True)
+def sma_series_nb(a, w):
+    """
+    시점별 단순 이동평균 배열 (값이 없는 구간은 NaN).
+    각 시점의 합은 sma_nb와 같은 순서로 창마다 다시 더한다.
+    """
+    n = a.shape[0]
+    out = np.full(n, np.nan)
+    for i in range(w - 1, n):
+        s = 0.0
+        for j in range(i - w + 1, i + 1):
+            s += a[j]
+        out[i] = s / w
+    return out
+
+
+@njit(cache=True)
+def bollinger_nb(a, w):
+    """마지막 w개 가격의 (평균, 모집단 표준편차). 평균을 먼저 구한 뒤 편차 제곱합을 더한다."""
+    n = a.shape[0]
+    s = 0.0
+    for i in range(n - w, n):
+        s += a[i]
+    mean = s / w
+
+    sq = 0.0
+    for i in range(n - w, n):
+        d = a[i] - mean
+        sq += d * d
+    return mean, (sq / w) ** 0.5
+
+
+@njit(cache=True)
+def bollinger_series_nb(a, w):
+    """
+    시점별 (평균, 모집단 표준편차) 배열 (값이 없는 구간은 NaN).
+    각 시점은 bollinger_nb와 같은 순서로 창마다 다시 계산한다.
+    """
+    n = a.shape[0]
+    means = np.full(n, np.nan)
+    stds = np.full(n, np.nan)
+    for i in range(w - 1, n):
+        s = 0.0
+        for j in range(i - w + 1, i + 1):
+            s += a[j]
+        mean = s / w
+
+        sq = 0.0
+        for j in range(i - w + 1, i + 1):
+            d = a[j] - mean
+            sq += d * d
+        means[i] = mean
+        stds[i] = (sq / w) ** 0.5
+    return means, stds
+
+
+@njit(cache=True)
+def ema_nb(a, w):
+    """처음 w개의 SMA로 시작하는 지수 이동평균."""
+    ema = 0.0
+    for i in range(w):
+        ema += a[i]
+    ema = ema / w
+
+    k = 2.0 / (w + 1)
+    for i in range(w, a.shape[0]):
+        ema = a[i] * k + ema * (1.0 - k)
+    return ema
+
+
+@njit(cache=True)
+def ema_series_nb(a, w):
+    """
+    시점별 지수 이동평균 배열 (값이 없는 구간은 NaN).
+    ema_nb와 같은 순서로 시작값을 더하고 같은 재귀식으로 갱신한다.
+    """
+    n = a.shape[0]
+    out = np.full(n, np.nan)
+    if n < w:
+        return out
+
+    ema = 0.0
+    for i in range(w):
+        ema += a[i]
+    ema = ema / w
+    out[w - 1] = ema
+
+    k = 2.0 / (w + 1)
+    for i in range(w, n):
+        ema = a[i] * k + ema * (1.0 - k)
+        out[i] = ema
+    return out
+
+
+@njit(cache=True)
+def rsi_nb(a, w):
+    """최근 w개 가격 변화량의 평균 상승/하락폭으로 계산한 RSI."""
+    gain = 0.0
+    loss = 0.0
+    n = a.shape[0]
+    for i in range(n - w, n):
+        change = a[i] - a[i - 1]
+        if change > 0:
+            gain += change
+        else:
+            loss -= change
+
+    if loss == 0.0:
+        return 100.0
+
+    rs = (gain / w) / (loss / w)
+    return 100.0 - (100.0 / (1.0 + rs))
+
+
+@njit(cache=True)
+def macd_nb(a, fast, slow, signal):
+    """
+    빠른/느린 EMA를 한 번의 순회로 갱신하며 (MACD, 시그널선)을 계산한다.
+    시그널선은 마지막 signal개 MACD 값의 평균이다.
+    """
+    n = a.shape[0]
+    k_f = 2.0 / (fast + 1)
+    k_s = 2.0 / (slow + 1)
+    start = n - signal
+
+    ema_f = 0.0
+    ema_s = 0.0
+    sig_sum = 0.0
+    for i in range(n):
+        p = a[i]
+        # 기간이 찰 때까지는 합을 모은 뒤 SMA로 시작
+        if i < fast:
+            ema_f += p
+            if i == fast - 1:
+                ema_f = ema_f / fast
+        else:
+            ema_f = p * k_f + ema_f * (1.0 - k_f)
+        if i < slow:
+            ema_s += p
+            if i == slow - 1:
+                ema_s = ema_s / slow
+        else:
+            ema_s = p * k_s + ema_s * (1.0 - k_s)
+
+        if i >= start:
+            sig_sum += ema_f - ema_s
+
+    return ema_f - ema_s, sig_sum / signal
+
+
+@njit(cache=True)
+def macd_series_nb(a, fast, slow, signal):
+    """
+    시점별 (MACD, 시그널선) 배열 (값이 없는 구간은 NaN).
+    MACD는 ema_series_nb 두 개의 차이이며, 시그널 합은 macd_nb와 같은 순서로 창마다 다시 더한다.
+    """
+    n = a.shape[0]
+    macd = ema_series_nb(a, fast) - ema_series_nb(a, slow)
+    sig = np.full(n, np.nan)
+    for i in range(slow + signal - 1, n):
+        s = 0.0
+        for j in range(i - signal + 1, i + 1):
+            s += macd[j]
+        sig[i] = s / signal
+    return macd, sig
+
+
+@njit(cache=True)
+def rsi_signals_nb(a, w, oversold, overbought):
+    """
+    시점별 RSI로 매매 신호를 만든다 (RSI < oversold → 1, RSI > overbought → -1).
+    각 시점의 상승/하락폭 합은 rsi_nb와 같은 순서로 창마다 다시 더한다.
+    """
+    n = a.shape[0]
+    out = np.zeros(n, dtype=np.int8)
+    for i in range(w, n):
+        gain = 0.0
+        loss = 0.0
+        for j in range(i - w + 1, i + 1):
+            change = a[j] - a[j - 1]
+            if change > 0:
+                gain += change
+            else:
+                loss -= change
+
+        if loss == 0.0:
+            rsi = 100.0
+        else:
+            rs = (gain / w) / (loss / w)
+            rsi = 100.0 - (100.0 / (1.0 + rs))
+
+        if rsi < oversold:
+            out[i] = 1
+        elif rsi > overbought:
+            out[i] = -1
+    return out
+
+
+@njit(cache=True)
+def momentum_signals_nb(a, period, threshold):
+    """
+    시점별 period일 수익률로 매매 신호를 만든다 (> threshold → 1, < -threshold → -1).
+    """
+    n = a.shape[0]
+    out = np.zeros(n, dtype=np.int8)
+    for i in range(period, n):
+        base = a[i - period]
+        momentum = (a[i] - base) / base
+        if momentum > threshold:
+            out[i] = 1
+        elif momentum < -threshold:
+            out[i] = -1
+    return out
@@ -0,0 +1,87 @@
+# src/mock_investing/jsonio.py
+"""
+JSON 직렬화 및 파일 저장 공용 모듈.
+orjson이 설치되어 있으면 사용하고, 없으면 표준 json 모듈로 대체합니다.
+"""
+
+import json
+import os
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # orjson을 지원하지 않는 환경
+    orjson = None
+
+
+# orjson 직렬화 옵션 (들여쓰기 2칸, 비문자열 키 허용, numpy 값 허용)
+if orjson is not None:
+    ORJSON_OPTIONS = (
+        orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+# 한 줄 JSON(JSONL)용 옵션 (들여쓰기 없음)
+if orjson is not None:
+    ORJSON_LINE_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# 파싱 실패 예외 (orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스)
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes):
+    """
+    JSON 바이트를 파이썬 객체로 변환한다.
+
+    Args:
+        data: JSON 바이트
+
+    Returns:
+        파싱된 객체
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj) -> bytes:
+    """
+    파이썬 객체를 JSON 바이트로 변환한다.
+
+    Args:
+        obj: 직렬화할 객체
+
+    Returns:
+        UTF-8 JSON 바이트 (들여쓰기 2칸)
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=ORJSON_OPTIONS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dumps_line(obj) -> bytes:
+    """
+    파이썬 객체를 줄바꿈으로 끝나는 한 줄 JSON 바이트로 변환한다 (JSONL 용).
+
+    Args:
+        obj: 직렬화할 객체
+
+    Returns:
+        UTF-8 JSON 바이트 + b"\n"
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=ORJSON_LINE_OPTIONS) + b"\n"
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    임시 파일에 쓴 뒤 os.replace로 교체한다.
+    저장 중 실패해도 기존 파일이 깨지지 않는다.
+
+    Args:
+        path: 저장할 파일 경로
+        data: 저장할 바이트
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
@@ -5,23 +5,19 @@
 """
 
 from pathlib import Path
-from typing import List
-from .models import Portfolio, Trade
+from .models import Portfolio, Trade, TradeLog, Side
 from .account import AccountManager, account_management_menu
-from .market_data import (
-    select_stock, download_stock_data, dataframe_to_price_list,
-    get_period_choice, print_stock_summary
-)
 from .strategies import get_strategy_menu, create_strategy, STRATEGY_NAMES
-from .strategy_config import StrategyConfigManager
+from .strategy_config import get_default_manager
 from .strategy_menu import strategy_settings_menu
-from .exec_engine import can_execute, execute_market
-from .storage import append_trade, read_trades
-from .visualization import (
-    plot_backtest_results, plot_candlestick_chart,
-    print_trade_statistics
-)
+try:  # build_numba.py로 미리 컴파일한 커널이 있으면 JIT 대기 없이 사용
+    from ._mock_investing_kernels import simulate as _simulate
+except ImportError:
+    from ._sim_numba import _simulate
+from .storage import write_trade_log, read_trades
 from .history import BacktestHistory, show_ranking_menu
+from .stats import compute_stats
+import numpy as np
 import pandas as pd
 
 
@@ -63,14 +59,18 @@ def print_main_menu():
     print("=" * 60)
 
 
-def run_backtest():
-    """백테스팅을 실행한다."""
+def run_backtest(account_manager: AccountManager):
+    """
+    백테스팅을 실행한다.
+    
+    Args:
+        account_manager: AccountManager 객체 (메인 메뉴와 공유)
+    """
     print("\n" + "=" * 60)
     print("📈 모의투자 백테스팅")
     print("=" * 60)
     
     # 계좌 잔액 확인
-    account_manager = AccountManager()
     initial_cash = account_manager.get_balance()
     
     if initial_cash < 10000:
@@ -79,6 +79,9 @@ def run_backtest():
     
     print(f"\n💰 현재 잔액: {initial_cash:,.0f}원")
     
+    # yfinance는 무거우므로 실제로 데이터를 받을 때 불러온다 (메뉴 시작 속도 개선)
+    from .market_data import select_stock, download_stock_data, get_period_choice
+    
     # 1. 종목 선택
     stock_info = select_stock()
     if not stock_info:
@@ -98,20 +101,19 @@ def run_backtest():
     # (차트만 보기 모드에서만 표시)
     
     # 4. 전략 선택 (커스텀 설정 적용)
-    print(get_strategy_menu())
+    # 공용 설정 관리자를 메뉴와 전략 생성에 같이 쓴다 (설정 파일은 처음 한 번만 읽음)
+    config_manager = get_default_manager()
+    print(get_strategy_menu(config_manager))
     strategy_choice = input("\n전략 선택: ").strip()
     
-    # 커스텀 설정 로드
-    config_manager = StrategyConfigManager()
     strategy_name = STRATEGY_NAMES.get(strategy_choice)
     if strategy_name:
-        custom_config = config_manager.get_config(strategy_name)
-        # description 제외한 파라미터만 전달
-        params = {k: v for k, v in custom_config.items() if k != 'description'}
+        # description 없이 파라미터만 전달
+        params = config_manager.get_params(strategy_name)
         strategy = create_strategy(strategy_choice, params)
         
         # 커스텀 설정 표시
-        if params != {k: v for k, v in config_manager.configs[strategy_name].items() if k != 'description'}:
+        if params != config_manager.get_defaults(strategy_name):
             print(f"\n⚙️  커스텀 설정 적용됨!")
     else:
         strategy = create_strategy(strategy_choice)
@@ -174,109 +176,56 @@ def run_backtest():
     # 6. 백테스팅 실행 (Next Open + Slippage)
     clear_previous_trades()
     
-    portfolio = Portfolio(initial_cash)
-    prices = dataframe_to_price_list(df)
+    # 루프에서 쓰는 열은 한 번만 NumPy 배열로 꺼내 둔다 (df.iloc 호출 비용 제거)
+    opens = df['Open'].to_numpy(dtype=np.float64, copy=False)
+    closes = df['Close'].to_numpy(dtype=np.float64, copy=False)
     
     print("\n🔄 백테스팅 실행 중...")
-    print(f"   데이터: {len(prices)}일")
+    print(f"   데이터: {len(closes)}일")
     print(f"   전략: {strategy.name}")
     print(f"   쿨다운: {cooldown_sec}일")
     print(f"   📌 현실성 개선: Next Open 체결 + 슬리피지 0.1%")
-    trades: List[Trade] = []
-    portfolio_values: List[float] = []
-    
-    # 디버깅용 카운터
-    trade_count = 0
-    buy_signals = 0
-    sell_signals = 0
-    blocked_by_cooldown = 0
-    blocked_by_no_asset = 0
-    blocked_by_no_cash = 0
-    pending_signal = None  # (action, signal_idx)
-    
-    for idx in range(len(df)):
-        # 현재가 업데이트 (종가 기준)
-        close_price = df.iloc[idx]['Close']
-        portfolio.last_price = close_price
-        portfolio_values.append(portfolio.equity())
-        
-        # 1. 이전에 발생한 신호가 있으면 오늘 시가로 체결
-        if pending_signal is not None:
-            action, signal_idx = pending_signal
-            open_price = df.iloc[idx]['Open']
-            
-            # 슬리피지 적용 (매수 +0.1%, 매도 -0.1%)
-            slippage_rate = 0.001
-            if action == "BUY":
-                execution_price = open_price * (1 + slippage_rate)
-            else:  # SELL
-                execution_price = open_price * (1 - slippage_rate)
-            
-            # 주문 금액 계산
-            order_cash = portfolio.cash * order_ratio
-            
-            try:
-                trade = execute_market(
-                    portfolio,
-                    action,
-                    execution_price,
-                    idx,  # 체결 시점
-                    fee_rate,
-                    order_cash,
-                    rule_name=strategy.name
-                )
-                trades.append(trade)
-                append_trade(trade, str(TRADES_CSV))
-                trade_count += 1
-                
-                if trade_count == 1:
-                    print(f"  ✅ 첫 거래 체결! (신호: {signal_idx}일 → 체결: {idx}일)")
-                elif trade_count % 5 == 0:
-                    print(f"  거래 {trade_count}건 체결...")
-            
-            except Exception as e:
-                print(f"  ⚠️  거래 실패: {e}")
-            
-            pending_signal = None
-        
-        # 2. 오늘 종가 기준으로 전략 평가
-        price_history = prices[:idx+1]
-        action = strategy.decide(price_history)
-        
-        if action == "KEEP":
-            continue
-        
-        # 신호 발생 카운트
-        if action == "BUY":
-            buy_signals += 1
-        elif action == "SELL":
-            sell_signals += 1
-        
-        # 마지막 날은 체결 불가 (다음날이 없음)
-        if idx >= len(df) - 1:
-            continue
-        
-        # 쿨다운 체크
-        if not can_execute(idx, portfolio.last_trade_ts, cooldown_sec):
-            blocked_by_cooldown += 1
-            continue
-        
-        # 매도: 보유 자산이 있어야 함
-        if action == "SELL" and portfolio.asset_qty == 0:
-            blocked_by_no_asset += 1
-            continue
-        
-        # 매수: 현금이 있어야 함
-        if action == "BUY" and portfolio.cash < 1000:
-            blocked_by_no_cash += 1
-            continue
-        
-        # 신호 저장 (다음날 체결 예약)
-        pending_signal = (action, idx)
+    cooldown_ms = cooldown_sec * 1000  # 쿨다운 기준값은 루프 밖에서 한 번만 계산
+    
+    # 시점별 전략 결정을 루프 전에 한 번에 계산 (각 결정은 그 시점까지의 가격만 사용)
+    signals = strategy.prepare(closes)
+    
+    # 체결 루프는 컴파일된 커널에서 실행 (체결 내역은 미리 할당한 배열에 기록)
+    n_bars = len(closes)
+    out_ts = np.empty(n_bars, dtype=np.int64)
+    out_side = np.empty(n_bars, dtype=np.int8)
+    out_price = np.empty(n_bars, dtype=np.float64)
+    out_qty = np.empty(n_bars, dtype=np.float64)
+    out_fee = np.empty(n_bars, dtype=np.float64)
+    out_signal_idx = np.empty(n_bars, dtype=np.int64)
+    portfolio_values = np.empty(n_bars, dtype=np.float64)
+    
+    # 커널은 현금/수량/가격을 지역 스칼라로만 다루고, 결과만 돌려준다
+    (cash, asset_qty, last_price, last_trade_ts,
+     trade_count, buy_signals, sell_signals,
+     blocked_by_cooldown, blocked_by_no_asset, blocked_by_no_cash) = _simulate(
+        closes, opens, signals, float(initial_cash), float(fee_rate), cooldown_ms,
+        float(order_ratio), 0.001, 1000.0,  # 슬리피지 0.1%, 최소 매수 현금 1000원
+        out_ts, out_side, out_price, out_qty, out_fee, out_signal_idx,
+        portfolio_values,
+    )
+    # 이후 청산/보고는 결과 스칼라로 만든 Portfolio 하나로 처리한다
+    portfolio = Portfolio(cash, asset_qty, last_price, last_trade_ts)
+    
+    # 커널 결과 배열을 그대로 열 단위 체결 기록으로 담는다
+    trade_log = TradeLog.from_arrays(
+        out_ts[:trade_count], out_side[:trade_count], out_price[:trade_count],
+        out_qty[:trade_count], out_fee[:trade_count], strategy.name
+    )
+    
+    if trade_count > 0:
+        print(f"  ✅ 첫 거래 체결! (신호: {out_signal_idx[0]}일 → 체결: {out_ts[0]}일)")
+    for count in range(5, trade_count + 1, 5):
+        print(f"  거래 {count}건 체결...")
     
     # 7. 백테스팅 종료 - 보유 주식 강제 청산
     if portfolio.asset_qty > 0:
-        final_price = prices[-1]
+        final_price = float(closes[-1])
         print(f"\n💼 백테스팅 종료 - 보유 주식 전량 청산")
         print(f"   보유량: {portfolio.asset_qty:.4f}주")
         print(f"   청산가: {final_price:,.0f}원")
@@ -288,24 +237,25 @@ def run_backtest():
         
         # 청산 거래 기록
         final_trade = Trade(
-            ts=len(prices)-1,
-            side="SELL",
+            ts=len(closes)-1,
+            side=Side.SELL,
             price=final_price,
             qty=portfolio.asset_qty,
             fee=sell_fee,
             rule_name=f"{strategy.name} (청산)"
         )
-        trades.append(final_trade)
-        append_trade(final_trade, str(TRADES_CSV))
+        trade_log.append(final_trade)
         
         portfolio.asset_qty = 0
         print(f"   ✅ 청산 완료! 수수료: {sell_fee:,.0f}원")
     
+    # 거래 내역은 백테스팅이 끝난 뒤 파일을 한 번만 열어 저장
+    if len(trade_log) > 0:
+        write_trade_log(trade_log, str(TRADES_CSV))
+    
     # 8. Buy & Hold 벤치마크 계산
-    first_price = df.iloc[0]['Open']
-    last_price = df.iloc[-1]['Close']
-    benchmark_qty = initial_cash / first_price
-    benchmark_final = benchmark_qty * last_price
+    # 첫날 시가에 전액 매수, 마지막 날 종가로 평가 (파이썬 float 스칼라 연산)
+    benchmark_final = initial_cash / float(opens[0]) * float(closes[-1])
     benchmark_profit_rate = ((benchmark_final - initial_cash) / initial_cash) * 100
     
     # 9. 결과 출력
@@ -313,15 +263,23 @@ def run_backtest():
     profit_loss = final_equity - initial_cash
     profit_rate = (profit_loss / initial_cash) * 100
     
+    # 거래 통계는 체결 기록 배열로 한 번에 계산
+    stats = compute_stats(trade_log, initial_cash, portfolio_values)
+    
     print("\n✅ 백테스팅 완료!")
     
+    # matplotlib도 결과를 출력/표시할 때 처음 불러온다
+    from .visualization import (
+        plot_backtest_results, plot_candlestick_chart, print_trade_statistics
+    )
+    
     # 거래가 없을 때 상세 안내
-    if not trades:
+    if len(trade_log) == 0:
         print("\n" + "=" * 60)
         print("⚠️  거래 내역이 없습니다")
         print("=" * 60)
         print("\n📊 신호 발생 분석:")
-        print(f"   • 총 데이터: {len(prices)}일")
+        print(f"   • 총 데이터: {len(closes)}일")
         print(f"   • BUY 신호 발생: {buy_signals}회")
         print(f"   • SELL 신호 발생: {sell_signals}회")
         print(f"   • 쿨다운에 막힘: {blocked_by_cooldown}회")
@@ -360,7 +318,7 @@ def run_backtest():
         
         print("\n" + "=" * 60)
     else:
-        print_trade_statistics(trades, initial_cash, final_equity)
+        print_trade_statistics(trade_log, initial_cash, final_equity, stats)
         
         # 벤치마크 비교 출력
         print("\n" + "=" * 60)
@@ -392,18 +350,22 @@ def run_backtest():
         period_map = {"1mo": "1개월", "3mo": "3개월", "6mo": "6개월", "1y": "1년"}
         
         # 거래 내역을 딕셔너리로 변환
+        columns = trade_log.to_dict()
+        # 체결 시점의 날짜 문자열을 한 번에 변환 (Timestamp를 하나씩 만들지 않음)
+        trade_dates = df.index[trade_log.ts].strftime('%Y-%m-%d').tolist()
         trades_data = []
-        for t in trades:
-            # 날짜 정보 추가
-            trade_date = df.index[t.ts].strftime('%Y-%m-%d')
+        for ts, date_str, side, price, qty, fee, rule in zip(
+            columns["ts"], trade_dates, columns["side"], columns["price"],
+            columns["qty"], columns["fee"], columns["rule"]
+        ):
             trades_data.append({
-                "ts": t.ts,
-                "date": trade_date,  # 실제 날짜 추가
-                "side": t.side,
-                "price": t.price,
-                "qty": t.qty,
-                "fee": t.fee,
-                "rule": t.rule_name
+                "ts": ts,
+                "date": date_str,  # 실제 날짜 추가
+                "side": side,
+                "price": price,
+                "qty": qty,
+                "fee": fee,
+                "rule": rule
             })
         
         result_data = {
@@ -415,8 +377,8 @@ def run_backtest():
             "final_equity": final_equity,
             "profit_loss": profit_loss,
             "profit_rate": profit_rate,
-            "trades_count": len(trades),
-            "total_fees": sum(t.fee for t in trades),
+            "trades_count": stats["trades_count"],
+            "total_fees": stats["total_fees"],
             "trades": trades_data,  # 거래 내역 저장
             "benchmark": {  # 벤치마크 정보 추가
                 "profit_rate": benchmark_profit_rate,
@@ -435,6 +397,7 @@ def run_backtest():
     
     # 계좌 잔액 업데이트
     account_manager.update_balance(portfolio.cash)
+    account_manager.flush()
     
     # 8. 시각화 옵션
     print("\n📊 결과 시각화:")
@@ -445,9 +408,9 @@ def run_backtest():
     viz_choice = input("\n선택: ").strip()
     
     if viz_choice == "1":
-        plot_backtest_results(df, trades, portfolio_values, strategy.name, ticker, initial_cash)
+        plot_backtest_results(df, trade_log, portfolio_values, strategy.name, ticker, initial_cash)
     elif viz_choice == "2":
-        plot_candlestick_chart(df, ticker, trades)
+        plot_candlestick_chart(df, ticker, trade_log)
 
 
 # review_trades 함수 제거됨 - 수익률 랭킹 메뉴로 통합
@@ -459,6 +422,11 @@ def view_chart_only():
     print("📉 차트 보기")
     print("=" * 60)
     
+    from .market_data import (
+        select_stock, download_stock_data, get_period_choice, print_stock_summary
+    )
+    from .visualization import plot_candlestick_chart, plot_simple_chart
+    
     # 종목 선택
     stock_info = select_stock()
     if not stock_info:
@@ -486,7 +454,6 @@ def view_chart_only():
     if choice == "1":
         plot_candlestick_chart(df, ticker)
     else:
-        from .visualization import plot_simple_chart
         plot_simple_chart(df, ticker)
 
 
@@ -508,7 +475,7 @@ def main() -> None:
             account_management_menu(account_manager)
         
         elif choice == "2":
-            run_backtest()
+            run_backtest(account_manager)
         
         elif choice == "3":
             show_ranking_menu(history)
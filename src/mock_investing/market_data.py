@@ -4,11 +4,24 @@
 yfinance를 사용하여 주식 데이터를 다운로드합니다.
 """
 
+import functools
+import pickle
+import time
+from datetime import date
+from pathlib import Path
 import yfinance as yf
+import numpy as np
 import pandas as pd
 from typing import Optional, List, Dict
 
 
+# 다운로드 캐시 저장 경로 (프로젝트 루트의 assets/cache)
+ASSETS_DIR = Path(__file__).resolve().parents[2] / "assets"
+CACHE_DIR = ASSETS_DIR / "cache"
+# 이 기간(일)보다 오래된 캐시 파일은 새로 저장할 때 삭제
+CACHE_KEEP_DAYS = 7
+
+
 # 주요 종목 티커 목록
 POPULAR_STOCKS = {
     # 한국 주식
@@ -47,6 +60,62 @@ def get_stock_menu() -> str:
     return menu
 
 
+def _cache_path(ticker: str, period: str) -> Path:
+    """(티커, 기간, 오늘 날짜)로 캐시 파일 경로를 만든다."""
+    safe_ticker = ticker.replace("/", "_").replace("\\", "_")
+    return CACHE_DIR / f"{safe_ticker}_{period}_{date.today().isoformat()}.pkl"
+
+
+def _save_cache(cache_path: Path, data: pd.DataFrame) -> None:
+    """
+    다운로드한 데이터를 캐시 파일로 저장하고 오래된 캐시를 정리한다.
+    저장에 실패해도 백테스팅에는 영향이 없으므로 무시한다.
+    
+    Args:
+        cache_path: 저장할 캐시 파일 경로
+        data: 다운로드한 DataFrame
+    """
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        data.to_pickle(cache_path)
+        
+        cutoff = time.time() - CACHE_KEEP_DAYS * 86400
+        for old in CACHE_DIR.glob("*.pkl"):
+            if old.stat().st_mtime < cutoff:
+                old.unlink()
+    except OSError:
+        pass
+
+
+def _ttl_cache(ttl_seconds: float):
+    """
+    티커별 조회 결과를 ttl_seconds 동안 메모리에 보관하는 데코레이터.
+    조회에 실패한 결과(None)는 저장하지 않아 다음 호출에서 다시 시도한다.
+    
+    Args:
+        ttl_seconds: 결과 유지 시간 (초)
+    """
+    def decorator(func):
+        cache: Dict[str, tuple] = {}  # 티커 → (결과, 만료 시각)
+        
+        @functools.wraps(func)
+        def wrapper(ticker: str):
+            now = time.monotonic()
+            entry = cache.get(ticker)
+            if entry is not None and entry[1] > now:
+                return entry[0]
+            
+            value = func(ticker)
+            if value is not None:
+                cache[ticker] = (value, now + ttl_seconds)
+            return value
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    
+    return decorator
+
+
 def download_stock_data(ticker: str, period: str = "3mo") -> Optional[pd.DataFrame]:
     """
     주식 데이터를 다운로드한다.
@@ -58,6 +127,15 @@ def download_stock_data(ticker: str, period: str = "3mo") -> Optional[pd.DataFra
     Returns:
         DataFrame 또는 None
     """
+    # 같은 날 같은 종목/기간을 이미 받았다면 디스크 캐시를 사용
+    cache_path = _cache_path(ticker, period)
+    try:
+        data = pd.read_pickle(cache_path)
+        print(f"\n📂 {ticker} 데이터 캐시에서 불러옴 ({len(data)}일치)")
+        return data
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+        pass
+    
     try:
         print(f"\n📥 {ticker} 데이터 다운로드 중...")
         stock = yf.Ticker(ticker)
@@ -68,6 +146,7 @@ def download_stock_data(ticker: str, period: str = "3mo") -> Optional[pd.DataFra
             return None
         
         print(f"✅ {len(data)}일치 데이터 다운로드 완료!")
+        _save_cache(cache_path, data)
         return data
     
     except Exception as e:
@@ -75,6 +154,66 @@ def download_stock_data(ticker: str, period: str = "3mo") -> Optional[pd.DataFra
         return None
 
 
+def download_many(tickers: List[str], period: str = "3mo") -> Dict[str, pd.DataFrame]:
+    """
+    여러 종목 데이터를 한 번에 다운로드한다.
+    캐시에 없는 종목만 yf.download로 병렬(스레드) 요청한다.
+    
+    Args:
+        tickers: 종목 티커 리스트
+        period: 기간 ("1mo", "3mo", "6mo", "1y" 등)
+        
+    Returns:
+        티커 → DataFrame 딕셔너리 (데이터를 받지 못한 종목은 빠짐)
+    """
+    result: Dict[str, pd.DataFrame] = {}
+    missing: List[str] = []
+    for ticker in tickers:
+        try:
+            result[ticker] = pd.read_pickle(_cache_path(ticker, period))
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            missing.append(ticker)
+    
+    if not missing:
+        return result
+    
+    try:
+        print(f"\n📥 {len(missing)}개 종목 데이터 다운로드 중...")
+        data = yf.download(
+            tickers=" ".join(missing),
+            period=period,
+            group_by="ticker",
+            threads=True,
+            progress=False,
+        )
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        return result
+    
+    if data is None or data.empty:
+        return result
+    
+    # 열이 (티커, 항목) 2단 구조이므로 종목별로 나눈다
+    # 거래일이 다른 종목끼리 합쳐진 행은 NaN이므로 제거한다
+    for ticker in missing:
+        if isinstance(data.columns, pd.MultiIndex):
+            if ticker not in data.columns.get_level_values(0):
+                continue
+            frame = data[ticker]
+        else:
+            frame = data
+        frame = frame.dropna(how="all")
+        if frame.empty:
+            continue
+        
+        result[ticker] = frame
+        _save_cache(_cache_path(ticker, period), frame)
+    
+    print(f"✅ {len(result)}/{len(tickers)}개 종목 준비 완료!")
+    return result
+
+
+@_ttl_cache(300)
 def get_stock_info(ticker: str) -> Optional[Dict]:
     """
     종목 정보를 가져온다.
@@ -102,6 +241,7 @@ def get_stock_info(ticker: str) -> Optional[Dict]:
         return None
 
 
+@_ttl_cache(30)
 def get_latest_price(ticker: str) -> Optional[float]:
     """
     최신 가격을 가져온다.
@@ -168,17 +308,18 @@ def select_stock() -> Optional[Dict]:
             return None
 
 
-def dataframe_to_price_list(df: pd.DataFrame) -> List[float]:
+def dataframe_to_price_list(df: pd.DataFrame) -> np.ndarray:
     """
-    DataFrame을 가격 리스트로 변환한다.
+    DataFrame에서 종가 배열을 꺼낸다.
+    파이썬 float 리스트로 바꾸지 않고 NumPy 배열(가능하면 복사 없는 뷰)을 그대로 돌려준다.
     
     Args:
         df: pandas DataFrame (yfinance 데이터)
         
     Returns:
-        종가(Close) 가격 리스트
+        종가(Close) 가격 배열 (float64)
     """
-    return df['Close'].tolist()
+    return df['Close'].to_numpy(dtype=np.float64, copy=False)
 
 
 def get_period_choice() -> str:
@@ -4,60 +4,275 @@ Portfolio와 Trade 클래스를 정의하는 모듈.
 강의 15강 Class 스타일로 구현.
 """
 
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import List
+import numpy as np
 
+
+class Side(IntEnum):
+    """매수/매도 구분 코드 (1바이트 정수로 저장 가능)."""
+
+    BUY = 0
+    SELL = 1
+
+
+# Side 코드 → 문자열 (CSV/JSON 저장 시에만 사용)
+SIDE_NAMES = ("BUY", "SELL")
+
+
+@dataclass(slots=True)
 class Portfolio:
-    """현재 포트폴리오 상태를 저장하는 클래스."""
+    """
+    현재 포트폴리오 상태를 저장하는 클래스.
+    
+    Attributes:
+        cash: 현금
+        asset_qty: 보유 수량
+        last_price: 최근 가격
+        last_trade_ts: 마지막 체결 시각 (ms 단위)
+    """
 
-    def __init__(self, cash: float) -> None:
-        """
-        포트폴리오를 초기화한다.
-        
-        Args:
-            cash: 초기 현금
-        """
-        self.cash = cash
-        self.asset_qty = 0.0
-        self.last_price = 0.0
-        self.last_trade_ts = 0  # ms 단위
+    cash: float
+    asset_qty: float = 0.0
+    last_price: float = 0.0
+    last_trade_ts: int = 0
 
     def equity(self) -> float:
         """
         총자산(cash + 보유자산 * 현재가)을 계산한다.
+        보유 수량이 없으면 곱셈 없이 현금을 그대로 돌려준다.
         
         Returns:
             총자산 금액
         """
+        if self.asset_qty == 0:
+            return self.cash
         return self.cash + self.asset_qty * self.last_price
 
 
+@dataclass(slots=True)
 class Trade:
-    """체결 1건에 대한 정보를 저장하는 클래스."""
+    """
+    체결 1건에 대한 정보를 저장하는 클래스.
+    
+    Attributes:
+        ts: 체결 시각(밀리초)
+        side: 매수/매도 구분 (Side.BUY or Side.SELL)
+        price: 체결 가격
+        qty: 체결 수량
+        fee: 수수료
+        rule_name: 적용된 규칙 이름
+    """
 
-    def __init__(
-        self,
-        ts: int,
-        side: str,
-        price: float,
-        qty: float,
-        fee: float,
-        rule_name: str,
-    ) -> None:
+    ts: int
+    side: Side
+    price: float
+    qty: float
+    fee: float
+    rule_name: str
+
+
+# 대량 체결 내역을 열(column) 단위로 담는 구조화 배열 형식
+# (Trade 객체 리스트보다 메모리가 작고 NumPy 집계가 가능)
+TRADE_DTYPE = np.dtype([
+    ("ts", np.int64),
+    ("side", np.int8),     # Side 코드 (0 = BUY, 1 = SELL)
+    ("price", np.float64),
+    ("qty", np.float64),
+    ("fee", np.float64),
+])
+
+
+class TradeLog:
+    """
+    체결 내역을 열(column)별 NumPy 배열로 모아 두는 클래스 (Structure of Arrays).
+    Trade 객체 리스트보다 메모리가 작고, 수수료 합계 등 집계를 NumPy로 바로 할 수 있다.
+    
+    Attributes:
+        ts: 체결 시각 배열 (int64)
+        side: 매수/매도 코드 배열 (int8, Side 값)
+        price: 체결 가격 배열
+        qty: 체결 수량 배열
+        fee: 수수료 배열
+        rule_names: 규칙 이름 리스트
+    """
+    
+    __slots__ = ("_ts", "_side", "_price", "_qty", "_fee", "rule_names", "_len")
+    
+    def __init__(self, capacity: int = 64):
+        capacity = max(capacity, 1)
+        self._ts = np.empty(capacity, dtype=np.int64)
+        self._side = np.empty(capacity, dtype=np.int8)
+        self._price = np.empty(capacity, dtype=np.float64)
+        self._qty = np.empty(capacity, dtype=np.float64)
+        self._fee = np.empty(capacity, dtype=np.float64)
+        self.rule_names: List[str] = []
+        self._len = 0
+    
+    @classmethod
+    def from_arrays(cls, ts, side, price, qty, fee, rule_name: str) -> "TradeLog":
         """
-        거래 정보를 초기화한다.
+        체결 배열들로 TradeLog를 만든다 (numba 커널 결과를 그대로 담을 때 사용).
         
         Args:
-            ts: 체결 시각(밀리초)
-            side: 매수/매도 구분 ("BUY" or "SELL")
-            price: 체결 가격
-            qty: 체결 수량
-            fee: 수수료
-            rule_name: 적용된 규칙 이름
+            ts, side, price, qty, fee: 길이가 같은 열 배열
+            rule_name: 모든 체결에 공통으로 적용된 규칙 이름
+            
+        Returns:
+            TradeLog 객체
         """
-        self.ts = ts
-        self.side = side
-        self.price = price
-        self.qty = qty
-        self.fee = fee
-        self.rule_name = rule_name
+        n = len(ts)
+        log = cls(n + 1)  # 청산 거래 1건을 추가해도 배열을 다시 만들지 않도록 여유를 둔다
+        log._ts[:n] = ts
+        log._side[:n] = side
+        log._price[:n] = price
+        log._qty[:n] = qty
+        log._fee[:n] = fee
+        log.rule_names = [rule_name] * n
+        log._len = n
+        return log
+    
+    @classmethod
+    def from_trades(cls, trades: List[Trade]) -> "TradeLog":
+        """
+        Trade 객체 리스트로 TradeLog를 만든다 (저장된 결과를 다시 불러올 때 사용).
+        
+        Args:
+            trades: Trade 객체 리스트
+            
+        Returns:
+            TradeLog 객체
+        """
+        n = len(trades)
+        log = cls(n)
+        log._ts[:n] = np.fromiter((t.ts for t in trades), dtype=np.int64, count=n)
+        log._side[:n] = np.fromiter((t.side for t in trades), dtype=np.int8, count=n)
+        log._price[:n] = np.fromiter((t.price for t in trades), dtype=np.float64, count=n)
+        log._qty[:n] = np.fromiter((t.qty for t in trades), dtype=np.float64, count=n)
+        log._fee[:n] = np.fromiter((t.fee for t in trades), dtype=np.float64, count=n)
+        log.rule_names = [t.rule_name for t in trades]
+        log._len = n
+        return log
+    
+    def __len__(self) -> int:
+        return self._len
+    
+    def _grow(self) -> None:
+        """용량을 두 배로 늘린다."""
+        capacity = self._ts.shape[0] * 2
+        self._ts = np.resize(self._ts, capacity)
+        self._side = np.resize(self._side, capacity)
+        self._price = np.resize(self._price, capacity)
+        self._qty = np.resize(self._qty, capacity)
+        self._fee = np.resize(self._fee, capacity)
+    
+    def append(self, trade: Trade) -> None:
+        """
+        체결 1건을 추가한다.
+        
+        Args:
+            trade: 추가할 Trade 객체
+        """
+        if self._len == self._ts.shape[0]:
+            self._grow()
+        
+        i = self._len
+        self._ts[i] = trade.ts
+        self._side[i] = trade.side
+        self._price[i] = trade.price
+        self._qty[i] = trade.qty
+        self._fee[i] = trade.fee
+        self.rule_names.append(trade.rule_name)
+        self._len = i + 1
+    
+    # 열 배열은 채워진 구간만 뷰로 돌려준다
+    @property
+    def ts(self) -> np.ndarray:
+        return self._ts[:self._len]
+    
+    @property
+    def side(self) -> np.ndarray:
+        return self._side[:self._len]
+    
+    @property
+    def price(self) -> np.ndarray:
+        return self._price[:self._len]
+    
+    @property
+    def qty(self) -> np.ndarray:
+        return self._qty[:self._len]
+    
+    @property
+    def fee(self) -> np.ndarray:
+        return self._fee[:self._len]
+    
+    def to_dict(self) -> dict:
+        """
+        열 이름 → 값 리스트 딕셔너리로 변환한다 (side는 "BUY"/"SELL" 문자열).
+        
+        Returns:
+            ts, side, price, qty, fee, rule 열을 담은 딕셔너리
+        """
+        return {
+            "ts": self.ts.tolist(),
+            "side": [SIDE_NAMES[s] for s in self.side.tolist()],
+            "price": self.price.tolist(),
+            "qty": self.qty.tolist(),
+            "fee": self.fee.tolist(),
+            "rule": list(self.rule_names),
+        }
+    
+    def to_trades(self) -> List[Trade]:
+        """
+        Trade 객체 리스트로 변환한다 (차트/통계 등 객체를 받는 함수용).
+        
+        Returns:
+            Trade 객체 리스트
+        """
+        return [
+            Trade(ts, Side(side), price, qty, fee, rule_name)
+            for ts, side, price, qty, fee, rule_name in zip(
+                self.ts.tolist(), self.side.tolist(), self.price.tolist(),
+                self.qty.tolist(), self.fee.tolist(), self.rule_names,
+            )
+        ]
 
 
+class PriceBuffer:
+    """
+    가격을 하나씩 쌓아 두는 float64 배열 버퍼.
+    전략의 decide()에는 버퍼를 그대로 넘기므로 호출마다 리스트→배열 변환이 없다.
+    가격은 추가만 할 수 있으므로 같은 버퍼의 길이가 같으면 내용도 같다.
+    
+    Attributes:
+        values: 지금까지 추가된 가격 배열 (읽기 전용 뷰)
+    """
+    
+    __slots__ = ("_buf", "_len")
+    
+    def __init__(self, capacity: int = 256):
+        self._buf = np.empty(max(capacity, 1), dtype=np.float64)
+        self._len = 0
+    
+    def __len__(self) -> int:
+        return self._len
+    
+    def append(self, price: float) -> None:
+        """
+        가격 1개를 추가한다. 용량이 차면 두 배로 늘린다.
+        
+        Args:
+            price: 추가할 가격
+        """
+        if self._len == self._buf.shape[0]:
+            self._buf = np.resize(self._buf, self._buf.shape[0] * 2)
+        self._buf[self._len] = price
+        self._len += 1
+    
+    @property
+    def values(self) -> np.ndarray:
+        # 뷰를 통해 값을 고치면 decide()의 (버퍼, 길이) 캐시가 틀어지므로 읽기 전용으로 내준다
+        view = self._buf[:self._len]
+        view.flags.writeable = False
+        return view
@@ -4,7 +4,10 @@ SMA(단순이동평균) 계산 및 매매 규칙을 정의하는 모듈.
 강의 4강 Function, 11강 Loop, 14강 DataCollectionTypes 스타일로 구현.
 """
 
+import math
 from typing import List, Optional
+import numpy as np
+import pandas as pd
 
 
 def compute_sma(prices: List[float], window: int) -> Optional[float]:
@@ -22,12 +25,30 @@ def compute_sma(prices: List[float], window: int) -> Optional[float]:
     if len(prices) < window:
         return None
     
-    window_prices = prices[-window:]
-    total = 0.0
-    for p in window_prices:
-        total = total + p
+    # math.fsum은 C로 구현되어 반복문보다 빠르고, 반올림 오차도 누적되지 않는다
+    return math.fsum(prices[-window:]) / window
+
+
+def precompute_sma(prices: np.ndarray, window: int) -> np.ndarray:
+    """
+    전체 구간의 SMA 시계열을 한 번에 계산한다.
+    결과[i]는 prices[:i+1]의 마지막 window개 평균이며, 값이 없는 구간은 NaN이다.
+    
+    Args:
+        prices: 가격 배열 (리스트도 허용)
+        window: 이동평균 기간
+        
+    Returns:
+        입력과 같은 길이의 SMA 배열
+    """
+    arr = np.asarray(prices, dtype=np.float64)
+    if window <= 0 or arr.shape[0] < window:
+        return np.full(arr.shape[0], np.nan)
     
-    return total / window
+    # pandas rolling은 구간 합을 증분 갱신하므로 O(N)이며,
+    # 같은 가격이 이어지는 구간에서는 오차 없이 그 가격을 그대로 돌려준다
+    # (누적합 차이 방식은 오차 때문에 fast == slow 비교가 깨질 수 있음)
+    return pd.Series(arr).rolling(window).mean().to_numpy()
 
 
 def decide_action(prices: List[float], fast: int, slow: int) -> str:
@@ -0,0 +1,64 @@
+# src/mock_investing/stats.py
+"""
+백테스팅 거래 통계 계산 모듈.
+TradeLog의 열 배열로 모든 통계를 NumPy 연산 한 번씩으로 계산합니다.
+"""
+
+from typing import Dict, Optional
+import numpy as np
+from .models import TradeLog, Side
+
+
+def compute_stats(log: TradeLog,
+                  initial_cash: float,
+                  portfolio_values: Optional[np.ndarray] = None) -> Dict:
+    """
+    거래 통계를 한 번에 계산한다.
+    매도 1건이 그 이전 매수 전체를 청산하므로, 매도 시점마다 왕복 거래 1회로 손익을 계산한다.
+
+    Args:
+        log: 체결 기록 (TradeLog)
+        initial_cash: 초기 자금
+        portfolio_values: 시점별 총자산 (최대 낙폭 계산용, 선택)
+
+    Returns:
+        통계 딕셔너리
+            - trades_count: 총 거래 횟수
+            - buy_count / sell_count: 매수/매도 횟수
+            - total_fees: 총 수수료
+            - win_rate: 승률 (%, 왕복 거래 기준)
+            - avg_win / avg_loss: 이익/손실 거래의 평균 손익
+            - max_drawdown: 최대 낙폭 (%)
+    """
+    is_sell = log.side == Side.SELL
+    sell_count = int(is_sell.sum())
+    fee = log.fee
+
+    # 매수는 (금액 + 수수료)만큼 현금 유출, 매도는 (금액 - 수수료)만큼 유입
+    notional = log.price * log.qty
+    flows = np.where(is_sell, notional - fee, -(notional + fee))
+
+    # 각 거래가 몇 번째 매도에서 청산되는지로 구간을 나눠 구간별 손익을 합산
+    # (마지막 매도 이후의 매수는 청산되지 않았으므로 제외)
+    segment = np.cumsum(is_sell) - is_sell
+    pnl = np.bincount(segment, weights=flows, minlength=sell_count)[:sell_count]
+    wins = pnl[pnl > 0]
+    losses = pnl[pnl < 0]
+
+    max_drawdown = 0.0
+    if portfolio_values is not None and len(portfolio_values) > 0:
+        values = np.asarray(portfolio_values, dtype=np.float64)
+        # 최고점은 초기 자금 이상으로 본다 (시작하자마자 손실이 나도 낙폭으로 잡힘)
+        peak = np.maximum(np.maximum.accumulate(values), initial_cash)
+        max_drawdown = float(((peak - values) / peak).max() * 100)
+
+    return {
+        "trades_count": len(log),
+        "buy_count": len(log) - sell_count,
+        "sell_count": sell_count,
+        "total_fees": float(fee.sum()),
+        "win_rate": len(wins) / sell_count * 100 if sell_count else 0.0,
+        "avg_win": float(wins.mean()) if len(wins) else 0.0,
+        "avg_loss": float(losses.mean()) if len(losses) else 0.0,
+        "max_drawdown": max_drawdown,
+    }
@@ -6,52 +6,119 @@
 
 import csv
 import os
-from .models import Trade
+from typing import List
+import pandas as pd
+from .models import Trade, TradeLog, SIDE_NAMES
+
+
+# trades.csv 헤더
+TRADE_HEADER = ["ts", "side", "price", "qty", "fee", "rule"]
+
+
+def _trade_row(trade: Trade) -> list:
+    """Trade 객체를 CSV 한 행으로 변환한다."""
+    return [
+        trade.ts,
+        SIDE_NAMES[trade.side],
+        trade.price,
+        trade.qty,
+        trade.fee,
+        trade.rule_name,
+    ]
+
+
+class TradeWriter:
+    """
+    CSV 파일을 한 번만 열어 두고 체결 내용을 이어 쓰는 클래스.
+    with 문으로 사용하며, 새 파일이면 헤더를 먼저 쓴다.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._writer = None
+    
+    def __enter__(self) -> "TradeWriter":
+        self._file = open(self.path, "a", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        # 파일 위치가 0이면 새 파일 (존재 여부를 따로 확인하지 않음)
+        if self._file.tell() == 0:
+            self._writer.writerow(TRADE_HEADER)
+        return self
+    
+    def append(self, trade: Trade) -> None:
+        """체결 내용을 한 행 추가한다."""
+        self._writer.writerow(_trade_row(trade))
+    
+    def extend(self, trades: List[Trade]) -> None:
+        """여러 체결 내용을 한 번에 추가한다."""
+        self._writer.writerows(_trade_row(trade) for trade in trades)
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._file.close()
+        self._file = None
+        self._writer = None
+
+
+def write_trades(trades: List[Trade], path: str) -> None:
+    """
+    여러 체결 내용을 파일을 한 번만 열어 CSV 파일 끝에 추가한다.
+    
+    Args:
+        trades: Trade 객체 리스트
+        path: 저장할 CSV 파일 경로
+    """
+    with TradeWriter(path) as writer:
+        writer.extend(trades)
+
+
+def write_trade_log(log: TradeLog, path: str) -> None:
+    """
+    열 단위 체결 기록(TradeLog)을 DataFrame으로 만들어 CSV 파일 끝에 한 번에 추가한다.
+    
+    Args:
+        log: TradeLog 객체
+        path: 저장할 CSV 파일 경로
+    """
+    df = pd.DataFrame(log.to_dict(), columns=TRADE_HEADER)
+    df.to_csv(path, mode="a", header=not os.path.exists(path), index=False, encoding="utf-8")
 
 
 def append_trade(trade: Trade, path: str) -> None:
     """
-    체결 내용을 CSV 파일 끝에 추가한다.
+    체결 내용을 CSV 파일 끝에 추가한다 (한 건만 쓸 때 사용).
     
     Args:
         trade: 체결된 Trade 객체
         path: 저장할 CSV 파일 경로
     """
-    file_exists = os.path.exists(path)
-    
-    with open(path, "a", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        if not file_exists:
-            writer.writerow(["ts", "side", "price", "qty", "fee", "rule"])
-        writer.writerow([
-            trade.ts,
-            trade.side,
-            trade.price,
-            trade.qty,
-            trade.fee,
-            trade.rule_name,
-        ])
+    write_trades([trade], path)
 
 
-def read_trades(path: str) -> list:
+def read_trades_df(path: str) -> pd.DataFrame:
     """
-    저장된 거래 내역을 읽어온다.
+    저장된 거래 내역을 DataFrame으로 읽어온다 (pandas C 파서로 한 번에 읽음).
     
     Args:
         path: CSV 파일 경로
         
     Returns:
-        거래 내역 리스트
+        거래 내역 DataFrame (파일이 없으면 빈 DataFrame)
     """
     if not os.path.exists(path):
-        return []
+        return pd.DataFrame(columns=TRADE_HEADER)
     
-    trades = []
-    with open(path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            trades.append(row)
-    
-    return trades
+    return pd.read_csv(path, encoding="utf-8", keep_default_na=False)
 
 
+def read_trades(path: str) -> list:
+    """
+    저장된 거래 내역을 읽어온다.
+    
+    Args:
+        path: CSV 파일 경로
+        
+    Returns:
+        거래 내역 리스트 (행마다 열 이름 → 값 딕셔너리)
+    """
+    return read_trades_df(path).to_dict("records")
@@ -4,31 +4,132 @@
 다양한 트레이딩 전략을 제공합니다.
 """
 
-from typing import List
+import os
+import sys
+from collections import ChainMap
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import product, repeat
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+import numpy as np
 from .indicators import (
     compute_sma, compute_ema, compute_rsi, 
-    compute_macd, compute_bollinger_bands
+    compute_macd, compute_bollinger_bands,
+    compute_sma_series, compute_ema_series, compute_macd_series, compute_bollinger_series,
+    StreamingBollinger, StreamingMACD
 )
+from .indicators_nb import rsi_signals_nb, momentum_signals_nb
+from .models import PriceBuffer
+from .strategy_config import DEFAULT_PARAMS, get_default_manager
+from .exec_engine import SIGNAL_BUY, SIGNAL_SELL, SIGNAL_KEEP
+
+
+# decide() 결과 문자열 (intern해 두어 호출자가 is로 비교할 수 있다)
+_BUY, _SELL, _KEEP = sys.intern("BUY"), sys.intern("SELL"), sys.intern("KEEP")
+
+# decide() 결과 문자열 → 신호 코드
+_SIGNAL_CODES = {_BUY: SIGNAL_BUY, _SELL: SIGNAL_SELL, _KEEP: SIGNAL_KEEP}
+# 신호 코드 + 1 → decide() 결과 문자열 (-1 → SELL, 0 → KEEP, 1 → BUY)
+_DECISIONS = (_SELL, _KEEP, _BUY)
+
+
+def _compare_decision(left: float, right: float) -> str:
+    """두 지표 값을 비교해 left > right → "BUY", left < right → "SELL", 같으면 "KEEP"을 반환한다."""
+    return _DECISIONS[int(left > right) - int(left < right) + 1]
+
+
+def _compare_signals(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """
+    두 지표 시계열을 시점별로 비교해 신호 배열을 만든다.
+    left > right → BUY, left < right → SELL, 같거나 NaN이면 KEEP.
+    
+    Args:
+        left: 기준 지표 배열 (예: 단기 이동평균)
+        right: 비교 지표 배열 (예: 장기 이동평균)
+        
+    Returns:
+        시점별 신호 배열 (int8)
+    """
+    # 비교 두 번과 뺄셈 한 번으로 -1/0/1을 만든다 (시점별 분기 없음, NaN은 둘 다 False → 0)
+    return (left > right).astype(np.int8) - (left < right).astype(np.int8)
 
 
 class Strategy:
     """매매 전략 기본 클래스"""
     
+    # decide() 결과 상수 (if sig is Strategy.BUY: 처럼 비교)
+    BUY = _BUY
+    SELL = _SELL
+    KEEP = _KEEP
+    
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
+        # 직전 decide()에 넘어온 PriceBuffer와 그때의 길이, 결과 (새 가격이 없으면 재계산 생략)
+        self._last_buffer: Optional[PriceBuffer] = None
+        self._last_len = 0
+        self._last_decision = None
     
-    def decide(self, prices: List[float]) -> str:
+    def decide(self, prices) -> str:
         """
         매매 결정을 내린다.
+        가격을 하나씩 받는 호출자는 PriceBuffer를 그대로 넘기면 values 뷰가 복사 없이 사용되고,
+        직전 호출 이후 같은 버퍼에 가격이 추가되지 않았으면 결과를 그대로 돌려준다
+        (화면을 다시 그릴 때처럼 같은 가격으로 반복 호출하는 경우).
+        버퍼는 추가만 가능하므로 (버퍼, 길이)만 비교하면 되어 입력 길이와 무관하게 O(1)이다.
         
         Args:
-            prices: 가격 리스트
+            prices: PriceBuffer 또는 가격 배열 (float64, 리스트도 허용)
+            
+        Returns:
+            "BUY", "SELL", 또는 "KEEP"
+        """
+        if not isinstance(prices, PriceBuffer):
+            return self._decide(prices)
+        
+        n = len(prices)
+        if prices is self._last_buffer and n == self._last_len:
+            return self._last_decision
+        
+        decision = self._decide(prices.values)
+        self._last_buffer = prices
+        self._last_len = n
+        self._last_decision = decision
+        return decision
+    
+    def _decide(self, prices: np.ndarray) -> str:
+        """
+        실제 매매 결정 규칙 (하위 클래스에서 구현).
+        하위 클래스는 지표 함수를 기본 인자(_sma=compute_sma 등)로 묶어 호출마다 전역 조회를 하지 않는다.
+        
+        Args:
+            prices: 가격 배열
             
         Returns:
             "BUY", "SELL", 또는 "KEEP"
         """
         raise NotImplementedError
+    
+    def prepare(self, prices: np.ndarray) -> np.ndarray:
+        """
+        전체 가격 배열에 대해 시점별 매매 신호를 한 번에 계산한다.
+        결과[i]는 decide(prices[:i+1])의 신호 코드와 같다 (미래 가격은 사용하지 않음).
+        기본 구현은 배열 뷰로 _decide를 호출하며, 지표를 미리 계산할 수 있는 전략은 재정의한다.
+        
+        Args:
+            prices: 가격 배열
+            
+        Returns:
+            시점별 신호 배열 (1 = BUY, -1 = SELL, 0 = KEEP, int8)
+        """
+        arr = np.asarray(prices, dtype=np.float64)
+        # 슬라이스는 복사 없는 뷰이므로 리스트 슬라이스보다 가볍다
+        return np.array(
+            # 시점마다 입력이 다르므로 decide()의 결과 캐시를 거치지 않는다
+            [_SIGNAL_CODES[self._decide(arr[:i + 1])] for i in range(arr.shape[0])],
+            dtype=np.int8
+        )
 
 
 class SMACrossover(Strategy):
@@ -42,21 +143,22 @@ class SMACrossover(Strategy):
         self.fast = fast
         self.slow = slow
     
-    def decide(self, prices: List[float]) -> str:
-        fast_sma = compute_sma(prices, self.fast)
-        slow_sma = compute_sma(prices, self.slow)
+    def _decide(self, prices: np.ndarray,
+                _sma=compute_sma, _compare=_compare_decision) -> str:
+        fast_sma = _sma(prices, self.fast)
+        slow_sma = _sma(prices, self.slow)
         
         if fast_sma is None or slow_sma is None:
-            return "KEEP"
+            return _KEEP
         
-        # 골든크로스: 단기 > 장기 -> 매수
-        if fast_sma > slow_sma:
-            return "BUY"
-        # 데드크로스: 단기 < 장기 -> 매도
-        elif fast_sma < slow_sma:
-            return "SELL"
-        else:
-            return "KEEP"
+        # 골든크로스: 단기 > 장기 -> 매수, 데드크로스: 단기 < 장기 -> 매도
+        return _compare(fast_sma, slow_sma)
+    
+    def prepare(self, prices: np.ndarray) -> np.ndarray:
+        # 빠른/느린 SMA 시계열을 한 번에 계산해 두고 시점별로 비교 (NaN 비교는 False → KEEP)
+        fast_sma = compute_sma_series(prices, self.fast)
+        slow_sma = compute_sma_series(prices, self.slow)
+        return _compare_signals(fast_sma, slow_sma)
     
     def get_params(self) -> dict:
         return {"fast": self.fast, "slow": self.slow}
@@ -73,19 +175,21 @@ class EMACrossover(Strategy):
         self.fast = fast
         self.slow = slow
     
-    def decide(self, prices: List[float]) -> str:
-        fast_ema = compute_ema(prices, self.fast)
-        slow_ema = compute_ema(prices, self.slow)
+    def _decide(self, prices: np.ndarray,
+                _ema=compute_ema, _compare=_compare_decision) -> str:
+        fast_ema = _ema(prices, self.fast)
+        slow_ema = _ema(prices, self.slow)
         
         if fast_ema is None or slow_ema is None:
-            return "KEEP"
+            return _KEEP
         
-        if fast_ema > slow_ema:
-            return "BUY"
-        elif fast_ema < slow_ema:
-            return "SELL"
-        else:
-            return "KEEP"
+        return _compare(fast_ema, slow_ema)
+    
+    def prepare(self, prices: np.ndarray) -> np.ndarray:
+        # 빠른/느린 EMA 시계열을 한 번에 계산해 두고 시점별로 비교
+        fast_ema = compute_ema_series(prices, self.fast)
+        slow_ema = compute_ema_series(prices, self.slow)
+        return _compare_signals(fast_ema, slow_ema)
     
     def get_params(self) -> dict:
         return {"fast": self.fast, "slow": self.slow}
@@ -103,20 +207,27 @@ class RSIStrategy(Strategy):
         self.oversold = oversold
         self.overbought = overbought
     
-    def decide(self, prices: List[float]) -> str:
-        rsi = compute_rsi(prices, self.period)
+    def _decide(self, prices: np.ndarray, _rsi=compute_rsi) -> str:
+        rsi = _rsi(prices, self.period)
         
         if rsi is None:
-            return "KEEP"
+            return _KEEP
         
         # 과매도 구간 -> 매수
         if rsi < self.oversold:
-            return "BUY"
+            return _BUY
         # 과매수 구간 -> 매도
         elif rsi > self.overbought:
-            return "SELL"
+            return _SELL
         else:
-            return "KEEP"
+            return _KEEP
+    
+    def prepare(self, prices: np.ndarray) -> np.ndarray:
+        # RSI는 창마다 순차 계산이 필요하므로 전체 구간을 컴파일된 루프 한 번으로 처리
+        arr = np.asarray(prices, dtype=np.float64)
+        return rsi_signals_nb(
+            arr, self.period, float(self.oversold), float(self.overbought)
+        )
     
     def get_params(self) -> dict:
         return {
@@ -137,21 +248,42 @@ class MACDStrategy(Strategy):
         self.fast = fast
         self.slow = slow
         self.signal = signal
+        self._stream = StreamingMACD(fast, slow, signal)
+    
+    def update(self, price: float) -> str:
+        """
+        가격을 하나씩 받는 호출자를 위한 O(1) 매매 결정.
+        두 EMA와 시그널선 상태만 갱신하므로 매번 전체 구간의 EMA를 다시 계산하지 않는다.
+        
+        Args:
+            price: 새 가격
+            
+        Returns:
+            "BUY", "SELL", 또는 "KEEP"
+        """
+        macd_data = self._stream.update(price)
+        
+        if macd_data is None:
+            return _KEEP
+        
+        return _compare_decision(macd_data["macd"], macd_data["signal"])
     
-    def decide(self, prices: List[float]) -> str:
-        macd_data = compute_macd(prices, self.fast, self.slow, self.signal)
+    def _decide(self, prices: np.ndarray,
+                _macd=compute_macd, _compare=_compare_decision) -> str:
+        macd_data = _macd(prices, self.fast, self.slow, self.signal)
         
         if macd_data is None:
-            return "KEEP"
+            return _KEEP
         
-        # MACD > Signal -> 매수
-        if macd_data["macd"] > macd_data["signal"]:
-            return "BUY"
-        # MACD < Signal -> 매도
-        elif macd_data["macd"] < macd_data["signal"]:
-            return "SELL"
-        else:
-            return "KEEP"
+        # MACD > Signal -> 매수, MACD < Signal -> 매도
+        return _compare(macd_data["macd"], macd_data["signal"])
+    
+    def prepare(self, prices: np.ndarray) -> np.ndarray:
+        # MACD선/시그널선 시계열을 한 번에 계산해 두고 시점별로 비교
+        macd_line, signal_line = compute_macd_series(
+            prices, self.fast, self.slow, self.signal
+        )
+        return _compare_signals(macd_line, signal_line)
     
     def get_params(self) -> dict:
         return {"fast": self.fast, "slow": self.slow, "signal": self.signal}
@@ -167,23 +299,58 @@ class BollingerBandsStrategy(Strategy):
         )
         self.period = period
         self.num_std = num_std
+        self._stream = StreamingBollinger(period, num_std)
+    
+    def update(self, price: float) -> str:
+        """
+        가격을 하나씩 받는 호출자를 위한 O(1) 매매 결정.
+        누적된 구간의 합/제곱합만 갱신하므로 매번 전체 구간을 다시 읽지 않는다.
+        
+        Args:
+            price: 새 가격
+            
+        Returns:
+            "BUY", "SELL", 또는 "KEEP"
+        """
+        bb = self._stream.update(price)
+        
+        if bb is None:
+            return _KEEP
+        
+        if price < bb["lower"]:
+            return _BUY
+        elif price > bb["upper"]:
+            return _SELL
+        else:
+            return _KEEP
     
-    def decide(self, prices: List[float]) -> str:
-        bb = compute_bollinger_bands(prices, self.period, self.num_std)
+    def _decide(self, prices: np.ndarray, _bb=compute_bollinger_bands) -> str:
+        # 전체 가격을 받는 경우는 마지막 period개만으로 밴드를 계산한다
+        bb = _bb(prices, self.period, self.num_std)
         
         if bb is None or len(prices) == 0:
-            return "KEEP"
+            return _KEEP
         
         current_price = prices[-1]
         
         # 하단밴드 근처 -> 매수
         if current_price < bb["lower"]:
-            return "BUY"
+            return _BUY
         # 상단밴드 근처 -> 매도
         elif current_price > bb["upper"]:
-            return "SELL"
+            return _SELL
         else:
-            return "KEEP"
+            return _KEEP
+    
+    def prepare(self, prices: np.ndarray) -> np.ndarray:
+        # 밴드 시계열을 한 번에 계산해 두고 시점별 가격과 비교 (NaN 비교는 False → KEEP)
+        arr = np.asarray(prices, dtype=np.float64)
+        upper, _, lower = compute_bollinger_series(arr, self.period, self.num_std)
+        
+        return np.where(
+            arr < lower, SIGNAL_BUY,
+            np.where(arr > upper, SIGNAL_SELL, SIGNAL_KEEP)
+        ).astype(np.int8)
     
     def get_params(self) -> dict:
         return {"period": self.period, "num_std": self.num_std}
@@ -200,21 +367,26 @@ class MomentumStrategy(Strategy):
         self.period = period
         self.threshold = threshold
     
-    def decide(self, prices: List[float]) -> str:
+    def _decide(self, prices: np.ndarray) -> str:
         if len(prices) < self.period + 1:
-            return "KEEP"
+            return _KEEP
         
         # 모멘텀 = (현재가 - N일전 가격) / N일전 가격
         momentum = (prices[-1] - prices[-self.period-1]) / prices[-self.period-1]
         
         # 양의 모멘텀 -> 매수
         if momentum > self.threshold:
-            return "BUY"
+            return _BUY
         # 음의 모멘텀 -> 매도
         elif momentum < -self.threshold:
-            return "SELL"
+            return _SELL
         else:
-            return "KEEP"
+            return _KEEP
+    
+    def prepare(self, prices: np.ndarray) -> np.ndarray:
+        # 시점별 N일 수익률과 신호를 컴파일된 루프 한 번으로 계산
+        arr = np.asarray(prices, dtype=np.float64)
+        return momentum_signals_nb(arr, self.period, float(self.threshold))
     
     def get_params(self) -> dict:
         return {"period": self.period, "threshold": self.threshold}
@@ -231,65 +403,116 @@ STRATEGY_NAMES = {
 }
 
 
-def get_strategy_menu() -> str:
-    """전략 선택 메뉴를 반환한다. 커스텀 설정 반영."""
-    from .strategy_config import StrategyConfigManager
-    
-    config_manager = StrategyConfigManager()
-    
-    menu = "\n📊 매매 전략 선택:\n"
-    menu += "=" * 60 + "\n"
-    
-    # SMA
-    sma_cfg = config_manager.get_config("SMA Crossover")
-    menu += f"\n1. SMA 크로스오버 ({sma_cfg['fast_period']}/{sma_cfg['slow_period']}) - 초보자 추천 ⭐\n"
-    menu += f"   📌 단기({sma_cfg['fast_period']}일) 평균이 장기({sma_cfg['slow_period']}일) 평균을 뚫으면 신호\n"
-    menu += f"   ✅ 매수: {sma_cfg['fast_period']}일 평균 > {sma_cfg['slow_period']}일 평균 (상승 추세)\n"
-    menu += f"   ❌ 매도: {sma_cfg['fast_period']}일 평균 < {sma_cfg['slow_period']}일 평균 (하락 추세)\n"
-    menu += "   💡 적합: 추세가 명확한 종목\n"
-    
-    # EMA
-    ema_cfg = config_manager.get_config("EMA Crossover")
-    menu += f"\n2. EMA 크로스오버 ({ema_cfg['fast_period']}/{ema_cfg['slow_period']}) - 빠른 반응\n"
-    menu += "   📌 SMA보다 최근 가격에 더 민감하게 반응\n"
-    menu += "   ✅ 매수: 단기 EMA > 장기 EMA\n"
-    menu += "   ❌ 매도: 단기 EMA < 장기 EMA\n"
-    menu += "   💡 적합: 빠른 매매를 원할 때\n"
-    
-    # RSI
-    rsi_cfg = config_manager.get_config("RSI Strategy")
-    menu += f"\n3. RSI 전략 (과매수/과매도) - 역추세 전략\n"
-    menu += "   📌 가격이 너무 오르면 팔고, 너무 내리면 사기\n"
-    menu += f"   ✅ 매수: RSI < {rsi_cfg['oversold']} (과매도, 반등 기대)\n"
-    menu += f"   ❌ 매도: RSI > {rsi_cfg['overbought']} (과매수, 하락 기대)\n"
-    menu += "   💡 적합: 횡보장, 변동성 큰 종목\n"
-    
-    # MACD
-    macd_cfg = config_manager.get_config("MACD Strategy")
-    menu += f"\n4. MACD 전략 ({macd_cfg['fast']}/{macd_cfg['slow']}/{macd_cfg['signal']}) - 추세 추종\n"
-    menu += "   📌 두 이동평균의 차이로 추세 변화 포착\n"
-    menu += "   ✅ 매수: MACD선 > 시그널선\n"
-    menu += "   ❌ 매도: MACD선 < 시그널선\n"
-    menu += "   💡 적합: 중장기 추세 거래\n"
-    
-    # Bollinger
-    bb_cfg = config_manager.get_config("Bollinger Bands")
-    menu += f"\n5. 볼린저 밴드 전략 ({bb_cfg['period']}일, {bb_cfg['std_dev']}σ) - 변동성 활용\n"
-    menu += "   📌 가격이 밴드 벗어나면 다시 돌아올 것 예상\n"
-    menu += "   ✅ 매수: 가격 < 하단밴드 (저평가)\n"
-    menu += "   ❌ 매도: 가격 > 상단밴드 (고평가)\n"
-    menu += "   💡 적합: 횡보장\n"
-    
-    # Momentum
-    mom_cfg = config_manager.get_config("Momentum Strategy")
-    menu += f"\n6. 모멘텀 전략 ({mom_cfg['period']}일, {mom_cfg['threshold']*100:.1f}%) - 강세 추종 🔥\n"
-    menu += f"   📌 최근 {mom_cfg['period']}일간 가격 상승/하락률로 판단\n"
-    menu += f"   ✅ 매수: {mom_cfg['period']}일 수익률 > {mom_cfg['threshold']*100:.1f}% (상승 모멘텀)\n"
-    menu += f"   ❌ 매도: {mom_cfg['period']}일 수익률 < -{mom_cfg['threshold']*100:.1f}% (하락 모멘텀)\n"
-    menu += "   💡 적합: 추세가 강한 종목\n"
-    
-    menu += "\n" + "=" * 60
-    return menu
+def get_strategy_menu(config_manager=None) -> str:
+    """
+    전략 선택 메뉴를 반환한다. 커스텀 설정 반영.
+    메뉴 문자열은 설정 값이 같으면 다시 만들지 않는다.
+    
+    Args:
+        config_manager: 설정 관리자 (없으면 공용 설정 관리자)
+        
+    Returns:
+        메뉴 문자열
+    """
+    if config_manager is None:
+        config_manager = get_default_manager()
+    
+    # 메뉴에 쓰이는 파라미터만 해시 가능한 튜플로 묶어 캐시 키로 쓴다
+    snapshot = tuple(
+        (name, tuple(config_manager.get_params(name).items()))
+        for name in STRATEGY_NAMES.values()
+    )
+    return _build_strategy_menu(snapshot)
+
+
+# 전략 선택 메뉴 템플릿 (설정 값 자리만 비워 두고 format_map으로 한 번에 채운다)
+_MENU_TEMPLATE = """
+📊 매매 전략 선택:
+{sep}
+
+1. SMA 크로스오버 ({sma_fast}/{sma_slow}) - 초보자 추천 ⭐
+   📌 단기({sma_fast}일) 평균이 장기({sma_slow}일) 평균을 뚫으면 신호
+   ✅ 매수: {sma_fast}일 평균 > {sma_slow}일 평균 (상승 추세)
+   ❌ 매도: {sma_fast}일 평균 < {sma_slow}일 평균 (하락 추세)
+   💡 적합: 추세가 명확한 종목
+
+2. EMA 크로스오버 ({ema_fast}/{ema_slow}) - 빠른 반응
+   📌 SMA보다 최근 가격에 더 민감하게 반응
+   ✅ 매수: 단기 EMA > 장기 EMA
+   ❌ 매도: 단기 EMA < 장기 EMA
+   💡 적합: 빠른 매매를 원할 때
+
+3. RSI 전략 (과매수/과매도) - 역추세 전략
+   📌 가격이 너무 오르면 팔고, 너무 내리면 사기
+   ✅ 매수: RSI < {rsi_oversold} (과매도, 반등 기대)
+   ❌ 매도: RSI > {rsi_overbought} (과매수, 하락 기대)
+   💡 적합: 횡보장, 변동성 큰 종목
+
+4. MACD 전략 ({macd_fast}/{macd_slow}/{macd_signal}) - 추세 추종
+   📌 두 이동평균의 차이로 추세 변화 포착
+   ✅ 매수: MACD선 > 시그널선
+   ❌ 매도: MACD선 < 시그널선
+   💡 적합: 중장기 추세 거래
+
+5. 볼린저 밴드 전략 ({bb_period}일, {bb_std}σ) - 변동성 활용
+   📌 가격이 밴드 벗어나면 다시 돌아올 것 예상
+   ✅ 매수: 가격 < 하단밴드 (저평가)
+   ❌ 매도: 가격 > 상단밴드 (고평가)
+   💡 적합: 횡보장
+
+6. 모멘텀 전략 ({mom_period}일, {mom_pct:.1f}%) - 강세 추종 🔥
+   📌 최근 {mom_period}일간 가격 상승/하락률로 판단
+   ✅ 매수: {mom_period}일 수익률 > {mom_pct:.1f}% (상승 모멘텀)
+   ❌ 매도: {mom_period}일 수익률 < -{mom_pct:.1f}% (하락 모멘텀)
+   💡 적합: 추세가 강한 종목
+
+{sep}"""
+
+
+@lru_cache(maxsize=4)
+def _build_strategy_menu(snapshot: tuple) -> str:
+    """설정 스냅샷 (전략 이름, 파라미터 튜플)로 전략 선택 메뉴 문자열을 만든다."""
+    configs = {name: dict(params) for name, params in snapshot}
+    sma_cfg = configs["SMA Crossover"]
+    ema_cfg = configs["EMA Crossover"]
+    rsi_cfg = configs["RSI Strategy"]
+    macd_cfg = configs["MACD Strategy"]
+    bb_cfg = configs["Bollinger Bands"]
+    mom_cfg = configs["Momentum Strategy"]
+    
+    return _MENU_TEMPLATE.format_map({
+        "sep": "=" * 60,
+        "sma_fast": sma_cfg['fast_period'],
+        "sma_slow": sma_cfg['slow_period'],
+        "ema_fast": ema_cfg['fast_period'],
+        "ema_slow": ema_cfg['slow_period'],
+        "rsi_oversold": rsi_cfg['oversold'],
+        "rsi_overbought": rsi_cfg['overbought'],
+        "macd_fast": macd_cfg['fast'],
+        "macd_slow": macd_cfg['slow'],
+        "macd_signal": macd_cfg['signal'],
+        "bb_period": bb_cfg['period'],
+        "bb_std": bb_cfg['std_dev'],
+        "mom_period": mom_cfg['period'],
+        "mom_pct": mom_cfg['threshold'] * 100,
+    })
+
+
+# 전략 번호 → (전략 클래스, 생성자 인자 순서대로의 설정 키)
+STRATEGY_SPECS = {
+    "1": (SMACrossover, ("fast_period", "slow_period")),
+    "2": (EMACrossover, ("fast_period", "slow_period")),
+    "3": (RSIStrategy, ("period", "oversold", "overbought")),
+    "4": (MACDStrategy, ("fast", "slow", "signal")),
+    "5": (BollingerBandsStrategy, ("period", "std_dev")),
+    "6": (MomentumStrategy, ("period", "threshold")),
+}
+
+# 전략 번호 → (전략 클래스, 인자 추출 함수, 기본 설정): 모듈 로드 시 한 번만 만든다
+_BOUND_SPECS = {
+    choice: (cls, itemgetter(*keys), DEFAULT_PARAMS[STRATEGY_NAMES[choice]])
+    for choice, (cls, keys) in STRATEGY_SPECS.items()
+}
 
 
 def create_strategy(choice: str, config: dict = None) -> Strategy:
@@ -303,47 +526,95 @@ def create_strategy(choice: str, config: dict = None) -> Strategy:
     Returns:
         Strategy 객체
     """
-    strategy_name = STRATEGY_NAMES.get(choice)
+    spec = _BOUND_SPECS.get(choice)
     
-    if not strategy_name:
+    if spec is None:
         return SMACrossover(5, 20)
     
-    # config가 없으면 기본값 사용
-    if config is None:
-        config = {}
-    
-    if strategy_name == "SMA Crossover":
-        fast = config.get('fast_period', 5)
-        slow = config.get('slow_period', 20)
-        return SMACrossover(fast, slow)
-    
-    elif strategy_name == "EMA Crossover":
-        fast = config.get('fast_period', 12)
-        slow = config.get('slow_period', 26)
-        return EMACrossover(fast, slow)
-    
-    elif strategy_name == "RSI Strategy":
-        period = config.get('period', 14)
-        oversold = config.get('oversold', 30)
-        overbought = config.get('overbought', 70)
-        return RSIStrategy(period, oversold, overbought)
-    
-    elif strategy_name == "MACD Strategy":
-        fast = config.get('fast', 12)
-        slow = config.get('slow', 26)
-        signal = config.get('signal', 9)
-        return MACDStrategy(fast, slow, signal)
-    
-    elif strategy_name == "Bollinger Bands":
-        period = config.get('period', 20)
-        std_dev = config.get('std_dev', 2.0)
-        return BollingerBandsStrategy(period, std_dev)
-    
-    elif strategy_name == "Momentum Strategy":
-        period = config.get('period', 10)
-        threshold = config.get('threshold', 0.02)
-        return MomentumStrategy(period, threshold)
-    
-    else:
-        return SMACrossover(5, 20)
+    # config에 없는 파라미터는 기본 설정값 사용 (ChainMap은 복사 없이 두 딕셔너리를 겹쳐 본다)
+    cls, get_args, defaults = spec
+    values = defaults if config is None else ChainMap(config, defaults)
+    return cls(*get_args(values))
+
+
+def _run_one(choice: str, prices: np.ndarray, config: Optional[dict]) -> np.ndarray:
+    """작업 프로세스에서 전략 하나를 만들어 전체 신호 배열을 계산한다 (피클 가능한 최상위 함수)."""
+    return create_strategy(choice, config).prepare(prices)
+
+
+def run_all_strategies(prices: np.ndarray,
+                       choices: Optional[List[str]] = None,
+                       configs: Optional[Dict[str, dict]] = None,
+                       n_workers: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """
+    여러 전략의 신호 배열을 프로세스 풀에서 병렬로 계산한다.
+    전략끼리는 서로 독립이므로 전략마다 작업 하나로 나눈다.
+    
+    Args:
+        prices: 가격 배열
+        choices: 전략 번호 리스트 (없으면 전체 전략)
+        configs: 전략 번호 → 파라미터 설정 (없는 전략은 기본값)
+        n_workers: 작업 프로세스 수 (기본 os.cpu_count())
+        
+    Returns:
+        전략 번호 → 시점별 신호 배열 딕셔너리
+    """
+    if choices is None:
+        choices = list(STRATEGY_NAMES)
+    if configs is None:
+        configs = {}
+    
+    arr = np.asarray(prices, dtype=np.float64)
+    workers = min(n_workers or os.cpu_count() or 1, len(choices)) or 1
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        results = ex.map(_run_one, choices, repeat(arr), [configs.get(c) for c in choices])
+        return dict(zip(choices, results))
+
+
+# grid_search 작업 프로세스가 공유하는 가격 배열 (프로세스마다 한 번만 전달)
+_WORKER_PRICES: Optional[np.ndarray] = None
+
+
+def _init_grid_worker(prices: np.ndarray) -> None:
+    """작업 프로세스 시작 시 가격 배열을 전역에 저장한다."""
+    global _WORKER_PRICES
+    _WORKER_PRICES = prices
+
+
+def _eval_params(cls: type, keys: Tuple[str, ...], combo: tuple) -> np.ndarray:
+    """파라미터 조합 하나로 전략을 만들어 전체 신호 배열을 계산한다 (피클 가능한 최상위 함수)."""
+    return cls(**dict(zip(keys, combo))).prepare(_WORKER_PRICES)
 
+
+def grid_search(strategy_cls: type,
+                prices: np.ndarray,
+                param_grid: Dict[str, list],
+                n_workers: Optional[int] = None) -> Dict[tuple, np.ndarray]:
+    """
+    파라미터 격자의 모든 조합에 대해 신호 배열을 프로세스 풀에서 병렬로 계산한다.
+    가격 배열은 작업마다 보내지 않고 프로세스 시작 시 한 번만 넘긴다.
+    
+    Args:
+        strategy_cls: 전략 클래스 (예: SMACrossover)
+        prices: 가격 배열
+        param_grid: 생성자 인자 이름 → 후보 값 리스트 (예: {"fast": [3, 5], "slow": [20, 30]})
+        n_workers: 작업 프로세스 수 (기본 os.cpu_count())
+        
+    Returns:
+        파라미터 값 튜플 (param_grid 키 순서) → 시점별 신호 배열 딕셔너리
+    """
+    keys = tuple(param_grid)
+    combos = list(product(*param_grid.values()))
+    if not combos:
+        return {}
+    
+    arr = np.asarray(prices, dtype=np.float64)
+    workers = min(n_workers or os.cpu_count() or 1, len(combos))
+    # 조합이 많을 때 작업 전달 횟수를 줄이도록 묶어서 보낸다
+    chunksize = max(1, len(combos) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_init_grid_worker,
+                             initargs=(arr,)) as ex:
+        results = ex.map(_eval_params, repeat(strategy_cls), repeat(keys), combos,
+                         chunksize=chunksize)
+        return dict(zip(combos, results))
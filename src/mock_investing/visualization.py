@@ -4,29 +4,141 @@
 거래 결과와 차트를 그래프로 표시합니다.
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from matplotlib import font_manager as fm
+import warnings
+import numpy as np
 import pandas as pd
-from typing import List, Dict
-from .models import Trade
+from typing import List, Dict, Optional, Tuple, Union
+from .models import Trade, TradeLog, Side
+
+
+# 매매 포인트 스타일: 매수/매도별 scatter 인자 (두 차트가 크기/색만 다르다)
+_BACKTEST_TRADE_STYLE = (
+    {"color": "green", "marker": "^", "s": 300, "label": "Buy",
+     "edgecolors": "darkgreen", "linewidths": 2, "alpha": 0.9},
+    {"color": "red", "marker": "v", "s": 300, "label": "Sell",
+     "edgecolors": "darkred", "linewidths": 2, "alpha": 0.9},
+)
+_CANDLE_TRADE_STYLE = (
+    {"color": "lime", "marker": "^", "s": 400, "label": "Buy",
+     "edgecolors": "darkgreen", "linewidths": 3, "alpha": 0.95},
+    {"color": "red", "marker": "v", "s": 400, "label": "Sell",
+     "edgecolors": "darkred", "linewidths": 3, "alpha": 0.95},
+)
+
+
+# matplotlib 초기화(한글 폰트 설정) 완료 여부
+# matplotlib은 차트를 처음 그릴 때 불러오므로, 폰트도 그때 한 번만 설정한다
+_MPL_READY = False
+
+
+# 날짜 축 눈금 형식 (처음 쓸 때 만들어 모든 축이 같이 쓴다)
+_DATE_FORMATTER = None
 
 
 # 한글 폰트 설정 (Windows)
 def setup_korean_font():
-    """한글 폰트를 설정한다."""
+    """한글 폰트를 설정한다. 이미 설정했으면 아무것도 하지 않는다."""
+    global _MPL_READY
+    if _MPL_READY:
+        return
+    _MPL_READY = True
+    import matplotlib.pyplot as plt
     try:
         # Windows 기본 폰트
         plt.rcParams['font.family'] = 'Malgun Gothic'
         plt.rcParams['axes.unicode_minus'] = False
-    except:
+    except Exception as e:
         # 폰트 설정 실패 시 기본 설정
-        pass
+        warnings.warn(f"한글 폰트 설정 실패: {e}")
+
+
+def _new_figure(nrows: int, figsize: Tuple[float, float]):
+    """
+    세로로 nrows개 서브플롯을 가진 Figure를 만든다.
+    
+    Args:
+        nrows: 서브플롯 행 수
+        figsize: Figure 크기
+        
+    Returns:
+        (Figure, Axes 튜플)
+    """
+    import matplotlib.pyplot as plt
+    fig, axes = plt.subplots(nrows, 1, figsize=figsize, squeeze=False)
+    return fig, tuple(axes[:, 0])
+
+
+def _show(fig) -> None:
+    """
+    Figure를 창을 닫을 때까지 표시한 뒤 닫는다.
+    닫힌 창의 Figure도 pyplot이 계속 들고 있으므로 직접 닫아야 차트를 그릴 때마다 메모리가 쌓이지 않는다.
+    """
+    import matplotlib.pyplot as plt
+    
+    fig.tight_layout()
+    try:
+        plt.show(block=True)
+    finally:
+        plt.close(fig)
+
+
+def _format_date_axis(ax) -> None:
+    """
+    x축을 날짜 눈금(YYYY-MM-DD, 45도 회전)으로 설정한다.
+    DateFormatter는 축 상태가 없어 하나를 공유하고,
+    AutoDateLocator는 축의 보기 범위를 참조하므로 축마다 새로 만든다.
+    
+    Args:
+        ax: 설정할 Axes
+    """
+    global _DATE_FORMATTER
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
+    
+    if _DATE_FORMATTER is None:
+        _DATE_FORMATTER = mdates.DateFormatter('%Y-%m-%d')
+    ax.xaxis.set_major_formatter(_DATE_FORMATTER)
+    ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+    plt.setp(ax.get_xticklabels(), rotation=45)
+
+
+def _as_trade_log(trades: Union[List[Trade], TradeLog]) -> TradeLog:
+    """
+    거래 내역을 열 배열(TradeLog)로 맞춘다. 이미 TradeLog면 그대로 쓴다.
+    
+    Args:
+        trades: 거래 내역 (Trade 리스트 또는 TradeLog)
+        
+    Returns:
+        TradeLog 객체
+    """
+    if isinstance(trades, TradeLog):
+        return trades
+    return TradeLog.from_trades(trades)
+
+
+def _split_trades(trades: TradeLog, n: int):
+    """
+    거래 내역을 매수/매도별 (봉 인덱스, 가격) 배열로 나눈다.
+    인덱스는 차트 범위를 벗어나지 않도록 [0, n-1]로 자른다.
+    
+    Args:
+        trades: 체결 기록 (TradeLog)
+        n: 가격 데이터 길이
+        
+    Returns:
+        (매수 인덱스, 매수 가격, 매도 인덱스, 매도 가격)
+    """
+    ts = np.clip(trades.ts, 0, n - 1)
+    px = trades.price
+    is_buy = trades.side == Side.BUY
+    is_sell = ~is_buy
+    return ts[is_buy], px[is_buy], ts[is_sell], px[is_sell]
 
 
 def plot_backtest_results(
     df: pd.DataFrame,
-    trades: List[Trade],
+    trades: Union[List[Trade], TradeLog],
     portfolio_values: List[float],
     strategy_name: str,
     ticker: str,
@@ -37,37 +149,32 @@ def plot_backtest_results(
     
     Args:
         df: 가격 데이터 DataFrame
-        trades: 거래 내역 리스트
-        portfolio_values: 포트폴리오 가치 시계열
+        trades: 거래 내역 (Trade 리스트 또는 TradeLog)
+        portfolio_values: 포트폴리오 가치 시계열 (리스트 또는 NumPy 배열)
         strategy_name: 전략 이름
         ticker: 종목 티커
         initial_cash: 초기 자금 (벤치마크 계산용, 선택)
     """
+    import matplotlib.dates as mdates
     setup_korean_font()
     
     # 2x1 서브플롯 생성
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
+    fig, (ax1, ax2) = _new_figure(2, (14, 10))
     fig.suptitle(f'{ticker} - {strategy_name} Backtest Results', 
                  fontsize=16, fontweight='bold')
     
+    # 날짜/종가는 한 번만 배열로 바꿔 모든 그래프에 같이 쓴다
+    # (tz가 있는 인덱스도 객체 배열이 되지 않도록 date2num으로 변환)
+    x = mdates.date2num(df.index)
+    close = df['Close'].to_numpy()
+    ax1.xaxis_date()
+    ax2.xaxis_date()
+    
     # 상단: 가격 차트 + 매매 포인트
-    ax1.plot(df.index, df['Close'], label='Price', color='blue', linewidth=1.5)
+    ax1.plot(x, close, label='Price', color='blue', linewidth=1.5)
     
     # 매수/매도 포인트 표시
-    buy_trades = [t for t in trades if t.side == "BUY"]
-    sell_trades = [t for t in trades if t.side == "SELL"]
-    
-    if buy_trades:
-        buy_dates = [df.index[min(t.ts, len(df)-1)] for t in buy_trades]
-        buy_prices = [t.price for t in buy_trades]
-        ax1.scatter(buy_dates, buy_prices, color='green', marker='^', 
-                   s=300, label='Buy', zorder=5, edgecolors='darkgreen', linewidths=2, alpha=0.9)
-    
-    if sell_trades:
-        sell_dates = [df.index[min(t.ts, len(df)-1)] for t in sell_trades]
-        sell_prices = [t.price for t in sell_trades]
-        ax1.scatter(sell_dates, sell_prices, color='red', marker='v', 
-                   s=300, label='Sell', zorder=5, edgecolors='darkred', linewidths=2, alpha=0.9)
+    _scatter_trades(ax1, x, _split_trades(_as_trade_log(trades), len(df)), _BACKTEST_TRADE_STYLE)
     
     ax1.set_xlabel('Date')
     ax1.set_ylabel('Price')
@@ -76,23 +183,23 @@ def plot_backtest_results(
     ax1.grid(True, alpha=0.3)
     
     # 날짜 형식 설정
-    ax1.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-    ax1.xaxis.set_major_locator(mdates.AutoDateLocator())
-    plt.setp(ax1.xaxis.get_majorticklabels(), rotation=45)
+    _format_date_axis(ax1)
     
     # 하단: 포트폴리오 가치 변화
-    if portfolio_values:
-        ax2.plot(df.index[:len(portfolio_values)], portfolio_values, 
+    # Line2D가 좌표를 float64로 다시 만들기 때문에 float32로 줄이지 않고 float64 배열로 한 번만 맞춘다
+    values = np.asarray(portfolio_values, dtype=np.float64)
+    n = len(values)
+    if n > 0:
+        dates = x[:n]
+        ax2.plot(dates, values, 
                 label='Strategy Portfolio', color='purple', linewidth=2.5, zorder=3)
-        ax2.axhline(y=portfolio_values[0], color='gray', linestyle='--', 
+        ax2.axhline(y=values[0], color='gray', linestyle='--', 
                    label='Initial Value', alpha=0.5)
         
         # Buy & Hold 벤치마크 선 추가
         if initial_cash is not None:
-            first_price = df.iloc[0]['Open']
-            benchmark_qty = initial_cash / first_price
-            benchmark_values = [benchmark_qty * price for price in df['Close'][:len(portfolio_values)]]
-            ax2.plot(df.index[:len(portfolio_values)], benchmark_values, 
+            benchmark_values = close[:n] * (initial_cash / df['Open'].iat[0])
+            ax2.plot(dates, benchmark_values, 
                     label='Buy & Hold (Benchmark)', color='lightcoral', 
                     linewidth=2, linestyle='--', alpha=0.8, zorder=2)
         
@@ -103,12 +210,9 @@ def plot_backtest_results(
         ax2.grid(True, alpha=0.3)
         
         # 날짜 형식 설정
-        ax2.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-        ax2.xaxis.set_major_locator(mdates.AutoDateLocator())
-        plt.setp(ax2.xaxis.get_majorticklabels(), rotation=45)
+        _format_date_axis(ax2)
     
-    plt.tight_layout()
-    plt.show()
+    _show(fig)
 
 
 def plot_simple_chart(df: pd.DataFrame, ticker: str) -> None:
@@ -119,75 +223,71 @@ def plot_simple_chart(df: pd.DataFrame, ticker: str) -> None:
         df: 가격 데이터 DataFrame
         ticker: 종목 티커
     """
+    import matplotlib.dates as mdates
     setup_korean_font()
     
-    plt.figure(figsize=(12, 6))
-    plt.plot(df.index, df['Close'], label='Close Price', linewidth=2)
+    fig, (ax,) = _new_figure(1, (12, 6))
+    ax.xaxis_date()
+    ax.plot(mdates.date2num(df.index), df['Close'].to_numpy(), label='Close Price', linewidth=2)
     
-    plt.title(f'{ticker} Price Chart', fontsize=14, fontweight='bold')
-    plt.xlabel('Date')
-    plt.ylabel('Price')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
+    ax.set_title(f'{ticker} Price Chart', fontsize=14, fontweight='bold')
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Price')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
     
     # 날짜 형식 설정
-    plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-    plt.gca().xaxis.set_major_locator(mdates.AutoDateLocator())
-    plt.xticks(rotation=45)
+    _format_date_axis(ax)
     
-    plt.tight_layout()
-    plt.show()
+    _show(fig)
 
 
-def plot_candlestick_chart(df: pd.DataFrame, ticker: str, trades: List[Trade] = None) -> None:
+def plot_candlestick_chart(df: pd.DataFrame, ticker: str,
+                           trades: Union[List[Trade], TradeLog] = None) -> None:
     """
     캔들스틱 차트를 표시한다.
     
     Args:
         df: 가격 데이터 DataFrame
         ticker: 종목 티커
-        trades: 거래 내역 (선택사항)
+        trades: 거래 내역 (Trade 리스트 또는 TradeLog, 선택사항)
     """
+    import matplotlib.dates as mdates
+    from matplotlib.collections import LineCollection, PolyCollection
     setup_korean_font()
     
-    fig, ax = plt.subplots(figsize=(14, 7))
+    x = mdates.date2num(df.index)
     
-    # 상승/하락 구분
-    up = df[df['Close'] >= df['Open']]
-    down = df[df['Close'] < df['Open']]
+    fig, (ax,) = _new_figure(1, (14, 7))
     
-    # 상승 캔들 (초록)
-    ax.bar(up.index, up['Close'] - up['Open'], width=0.8, 
-           bottom=up['Open'], color='green', alpha=0.8)
-    ax.bar(up.index, up['High'] - up['Close'], width=0.1, 
-           bottom=up['Close'], color='green', alpha=0.8)
-    ax.bar(up.index, up['Open'] - up['Low'], width=0.1, 
-           bottom=up['Low'], color='green', alpha=0.8)
+    # 캔들 몸통/꼬리 좌표를 배열 연산으로 한 번에 만든다 (봉마다 Rectangle을 만들지 않음)
+    open_, close, high, low = df[['Open', 'Close', 'High', 'Low']].to_numpy(dtype=np.float64).T
+    up = close >= open_
+    colors = np.where(up, 'green', 'red')
     
-    # 하락 캔들 (빨강)
-    ax.bar(down.index, down['Open'] - down['Close'], width=0.8, 
-           bottom=down['Close'], color='red', alpha=0.8)
-    ax.bar(down.index, down['High'] - down['Open'], width=0.1, 
-           bottom=down['Open'], color='red', alpha=0.8)
-    ax.bar(down.index, down['Close'] - down['Low'], width=0.1, 
-           bottom=down['Low'], color='red', alpha=0.8)
+    # 몸통: (N, 4, 2) 사각형 꼭짓점
+    left = x - 0.4
+    right = x + 0.4
+    bodies = np.stack([
+        np.column_stack([left, open_]),
+        np.column_stack([right, open_]),
+        np.column_stack([right, close]),
+        np.column_stack([left, close]),
+    ], axis=1)
+    # 꼬리: (N, 2, 2) 저가-고가 선분
+    wicks = np.stack([
+        np.column_stack([x, low]),
+        np.column_stack([x, high]),
+    ], axis=1)
+    
+    ax.add_collection(LineCollection(wicks, colors=colors, linewidths=1, alpha=0.8))
+    ax.add_collection(PolyCollection(bodies, facecolors=colors, edgecolors='none', alpha=0.8))
+    ax.xaxis_date()
+    ax.autoscale_view()
     
     # 거래 포인트 표시
     if trades:
-        buy_trades = [t for t in trades if t.side == "BUY"]
-        sell_trades = [t for t in trades if t.side == "SELL"]
-        
-        if buy_trades:
-            buy_dates = [df.index[min(t.ts, len(df)-1)] for t in buy_trades]
-            buy_prices = [t.price for t in buy_trades]
-            ax.scatter(buy_dates, buy_prices, color='lime', marker='^', 
-                      s=400, label='Buy', zorder=5, edgecolors='darkgreen', linewidths=3, alpha=0.95)
-        
-        if sell_trades:
-            sell_dates = [df.index[min(t.ts, len(df)-1)] for t in sell_trades]
-            sell_prices = [t.price for t in sell_trades]
-            ax.scatter(sell_dates, sell_prices, color='red', marker='v', 
-                      s=400, label='Sell', zorder=5, edgecolors='darkred', linewidths=3, alpha=0.95)
+        _scatter_trades(ax, x, _split_trades(_as_trade_log(trades), len(df)), _CANDLE_TRADE_STYLE)
     
     ax.set_title(f'{ticker} Candlestick Chart', fontsize=14, fontweight='bold')
     ax.set_xlabel('Date')
@@ -197,31 +297,59 @@ def plot_candlestick_chart(df: pd.DataFrame, ticker: str, trades: List[Trade] =
     ax.grid(True, alpha=0.3)
     
     # 날짜 형식 설정
-    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-    ax.xaxis.set_major_locator(mdates.AutoDateLocator())
-    plt.xticks(rotation=45)
+    _format_date_axis(ax)
     
-    plt.tight_layout()
-    plt.show()
+    _show(fig)
 
 
-def print_trade_statistics(trades: List[Trade], initial_cash: float, final_equity: float) -> None:
+def _scatter_trades(ax, x, split, style: tuple) -> list:
+    """
+    _split_trades로 나눈 배열로 매수/매도 포인트를 그린다.
+    마커 모양(▲/▼)을 유지하려고 면마다 scatter를 하나씩 쓴다
+    (한 collection에 모양을 섞으면 Agg의 마커 복사 경로를 못 써서 오히려 느려진다).
+    
+    Args:
+        ax: 그릴 Axes
+        x: 봉별 날짜 좌표 (date2num)
+        split: _split_trades 결과 (매수 인덱스, 매수 가격, 매도 인덱스, 매도 가격)
+        style: (매수, 매도) scatter 인자 (_BACKTEST_TRADE_STYLE 등)
+        
+    Returns:
+        추가한 artist 리스트
+    """
+    buy_idx, buy_prices, sell_idx, sell_prices = split
+    artists = []
+    for idx, prices, kwargs in ((buy_idx, buy_prices, style[0]), (sell_idx, sell_prices, style[1])):
+        if len(idx):
+            artists.append(ax.scatter(x[idx], prices, zorder=5, **kwargs))
+    return artists
+
+
+def print_trade_statistics(trades: Union[List[Trade], TradeLog], initial_cash: float, final_equity: float,
+                           stats: Optional[dict] = None) -> None:
     """
     거래 통계를 출력한다.
     
     Args:
-        trades: 거래 내역 리스트
+        trades: 거래 내역 (Trade 리스트 또는 TradeLog)
         initial_cash: 초기 자금
         final_equity: 최종 자산
+        stats: stats.compute_stats 결과 (있으면 다시 계산하지 않고 승률/낙폭도 출력)
     """
     if not trades:
         print("\n거래 내역이 없습니다.")
         return
     
-    buy_trades = [t for t in trades if t.side == "BUY"]
-    sell_trades = [t for t in trades if t.side == "SELL"]
-    
-    total_fees = sum(t.fee for t in trades)
+    if stats is not None:
+        buy_count = stats["buy_count"]
+        sell_count = stats["sell_count"]
+        total_fees = stats["total_fees"]
+    else:
+        # 매수 횟수와 수수료 합계를 열 배열 연산으로 계산한다
+        log = _as_trade_log(trades)
+        buy_count = int(np.count_nonzero(log.side == Side.BUY))
+        sell_count = len(log) - buy_count
+        total_fees = float(log.fee.sum())
     profit = final_equity - initial_cash
     profit_rate = (profit / initial_cash) * 100
     
@@ -229,12 +357,16 @@ def print_trade_statistics(trades: List[Trade], initial_cash: float, final_equit
     print("📊 거래 통계")
     print("=" * 60)
     print(f"총 거래 횟수:  {len(trades)}회")
-    print(f"  - 매수:      {len(buy_trades)}회")
-    print(f"  - 매도:      {len(sell_trades)}회")
+    print(f"  - 매수:      {buy_count}회")
+    print(f"  - 매도:      {sell_count}회")
     print(f"총 수수료:     {total_fees:,.2f}원")
+    if stats is not None:
+        print(f"승률:          {stats['win_rate']:.1f}% (매도 {sell_count}회 기준)")
+        print(f"평균 이익:     {stats['avg_win']:+,.0f}원")
+        print(f"평균 손실:     {stats['avg_loss']:+,.0f}원")
+        print(f"최대 낙폭:     {stats['max_drawdown']:.2f}%")
     print(f"\n초기 자금:     {initial_cash:,.0f}원")
     print(f"최종 자산:     {final_equity:,.0f}원")
     print(f"손익:          {profit:+,.0f}원")
     print(f"수익률:        {profit_rate:+.2f}%")
     print("=" * 60)
-
@@ -0,0 +1,62 @@
+"""테스트 공용 가격 시계열 및 계산 경로(순수 파이썬/numba) 픽스처."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from mock_investing import _sim_numba, indicators, strategies
+
+
+ASSETS_DIR = Path(__file__).resolve().parents[1] / "assets"
+
+
+def _sample_prices() -> np.ndarray:
+    """저장소에 포함된 price_sample.csv의 가격 열."""
+    data = np.genfromtxt(ASSETS_DIR / "price_sample.csv", delimiter=",", names=True)
+    return np.asarray(data["price"], dtype=np.float64)
+
+
+def _random_walk(scale: float, seed: int) -> np.ndarray:
+    """양수로 유지되는 곱셈형 랜덤 워크."""
+    rng = np.random.default_rng(seed)
+    return scale * np.exp(np.cumsum(rng.normal(0.0, 0.02, 250)))
+
+
+PRICE_SERIES = {
+    "random_walk": lambda: _random_walk(100.0, 0),
+    "krw_scale": lambda: np.round(_random_walk(70000.0, 1), -2),
+    "flat": lambda: np.full(120, 50000.0),
+    "step": lambda: np.repeat([100.0, 120.0, 90.0, 90.0, 130.0], 30),
+    "sample": _sample_prices,
+    # 소수 가격은 같은 값의 평균도 합산 순서에 따라 마지막 자리가 달라질 수 있다
+    "flat_decimal": lambda: np.full(120, 0.1),
+    "cents_step": lambda: np.repeat(np.round(10.0 + 0.01 * np.arange(6), 2), 25),
+    "cents_walk": lambda: np.round(_random_walk(100.0, 2), 2),
+}
+
+
+@pytest.fixture(params=sorted(PRICE_SERIES))
+def prices(request) -> np.ndarray:
+    """여러 모양의 가격 시계열 (float64)."""
+    return PRICE_SERIES[request.param]()
+
+
+@pytest.fixture(params=["python", "numba"])
+def backend(request, monkeypatch) -> str:
+    """
+    지표/신호/체결 커널의 계산 경로를 고른다.
+    "python"은 numba가 설치되어 있어도 컴파일 전 함수(py_func)를 쓰고,
+    "numba"는 numba가 없으면 건너뛴다.
+    """
+    if request.param == "numba":
+        pytest.importorskip("numba")
+        assert indicators.HAVE_NUMBA
+        return request.param
+    
+    monkeypatch.setattr(indicators, "HAVE_NUMBA", False)
+    for module in (indicators, strategies, _sim_numba):
+        for name, obj in list(vars(module).items()):
+            if hasattr(obj, "py_func"):
+                monkeypatch.setattr(module, name, obj.py_func)
+    return request.param
@@ -0,0 +1,82 @@
+"""BacktestHistory의 JSONL 저장, 이전 파일 변환, 손상된 줄 처리를 확인한다."""
+
+import json
+
+import pytest
+
+from mock_investing import history as history_mod
+from mock_investing.history import BacktestHistory
+
+
+@pytest.fixture
+def paths(tmp_path, monkeypatch):
+    """히스토리 파일 경로를 임시 폴더로 바꾸고, 공유 추가용 디스크립터를 닫아 둔다."""
+    jsonl = tmp_path / "backtest_history.jsonl"
+    legacy = tmp_path / "backtest_history.json"
+    monkeypatch.setattr(history_mod, "HISTORY_FILE", jsonl)
+    monkeypatch.setattr(history_mod, "LEGACY_HISTORY_FILE", legacy)
+    history_mod._close_append_fd()
+    yield jsonl, legacy
+    history_mod._close_append_fd()
+
+
+def _reopen() -> BacktestHistory:
+    """캐시와 디스크립터 없이 파일을 처음부터 다시 읽는 새 인스턴스."""
+    history_mod._close_append_fd()
+    return BacktestHistory()
+
+
+def test_append_and_reload(paths):
+    history = BacktestHistory()
+    history.add_result({"profit_rate": 1.5})
+    history.add_result_batch([{"profit_rate": -2.0}, {"profit_rate": 3.0}])
+    
+    records = _reopen().load_history()
+    assert [r["id"] for r in records] == [1, 2, 3]
+    assert [r["profit_rate"] for r in records] == [1.5, -2.0, 3.0]
+
+
+def test_legacy_file_is_migrated(paths):
+    jsonl, legacy = paths
+    legacy.write_text(json.dumps([{"id": 1, "profit_rate": 2.0},
+                                  {"id": 2, "profit_rate": -1.0}]))
+    
+    history = BacktestHistory()
+    history.add_result({"profit_rate": 0.5})
+    
+    assert not legacy.exists()
+    assert legacy.with_suffix(".json.bak").exists()
+    assert [r["id"] for r in _reopen().load_history()] == [1, 2, 3]
+
+
+def test_corrupt_legacy_file_starts_empty(paths):
+    jsonl, legacy = paths
+    legacy.write_text('[{"id": 1, "profit_ra')
+    
+    history = BacktestHistory()
+    
+    assert history.load_history() == []
+    assert legacy.with_suffix(".json.bak").exists()
+    assert jsonl.read_bytes() == b""
+
+
+def test_torn_trailing_line_is_skipped(paths):
+    jsonl, _ = paths
+    BacktestHistory().add_result_batch([{"profit_rate": 1.0}, {"profit_rate": 2.0}])
+    with open(jsonl, "ab") as f:
+        f.write(b'{"id": 99, "profit_ra')
+    
+    history = _reopen()
+    assert [r["id"] for r in history.load_history()] == [1, 2]
+    
+    # 새 기록은 끊긴 줄에 이어 붙지 않고, ID도 겹치지 않는다
+    history.add_result({"profit_rate": 3.0})
+    assert [r["id"] for r in _reopen().load_history()] == [1, 2, 3]
+
+
+def test_load_history_returns_a_copy(paths):
+    history = BacktestHistory()
+    history.add_result({"profit_rate": 1.0})
+    
+    history.load_history().clear()
+    assert len(history.load_history()) == 1
@@ -0,0 +1,94 @@
+"""체결 커널(_simulate)이 순수 파이썬/numba 경로 모두에서 execute_market 기반 봉 단위 루프와 같은 결과를 내는지 확인한다."""
+
+import numpy as np
+import pytest
+
+from mock_investing import _sim_numba
+from mock_investing.exec_engine import execute_market
+from mock_investing.models import Portfolio, Side
+from mock_investing.strategies import STRATEGY_SPECS, create_strategy
+
+
+SLIPPAGE = 0.001
+MIN_CASH = 1000.0
+
+
+def _reference(closes, opens, signals, initial_cash, fee_rate, cooldown_ms, order_ratio):
+    """커널 도입 전의 봉 단위 체결 루프 (Next Open + 슬리피지)."""
+    portfolio = Portfolio(initial_cash)
+    trades = []
+    values = []
+    counts = [0, 0, 0, 0, 0]  # BUY/SELL 신호, 쿨다운/자산 없음/현금 부족 차단
+    pending = None
+    
+    for idx in range(len(closes)):
+        portfolio.last_price = closes[idx]
+        values.append(portfolio.equity())
+        
+        if pending is not None:
+            side, signal_idx = pending
+            if side == Side.BUY:
+                price = opens[idx] * (1 + SLIPPAGE)
+            else:
+                price = opens[idx] * (1 - SLIPPAGE)
+            trade = execute_market(portfolio, side, price, idx, fee_rate,
+                                   portfolio.cash * order_ratio, "ref")
+            trades.append((trade.ts, int(trade.side), trade.price, trade.qty,
+                           trade.fee, signal_idx))
+            pending = None
+        
+        sig = signals[idx]
+        if sig == 0:
+            continue
+        counts[0 if sig == 1 else 1] += 1
+        if idx >= len(closes) - 1:
+            continue
+        if idx - portfolio.last_trade_ts < cooldown_ms:
+            counts[2] += 1
+            continue
+        if sig == -1 and portfolio.asset_qty == 0:
+            counts[3] += 1
+            continue
+        if sig == 1 and portfolio.cash < MIN_CASH:
+            counts[4] += 1
+            continue
+        pending = (Side.BUY if sig == 1 else Side.SELL, idx)
+    
+    return portfolio, trades, values, counts
+
+
+@pytest.mark.parametrize("cooldown_ms", [0, 3])
+@pytest.mark.parametrize("choice", sorted(STRATEGY_SPECS))
+def test_simulate_matches_reference(choice, cooldown_ms, prices, backend):
+    closes = prices
+    opens = np.concatenate(([closes[0]], closes[:-1])) * 1.001
+    signals = create_strategy(choice).prepare(closes)
+    initial_cash, fee_rate, order_ratio = 1_000_000.0, 0.0005, 0.3
+    
+    n = len(closes)
+    out_ts = np.empty(n, dtype=np.int64)
+    out_side = np.empty(n, dtype=np.int8)
+    out_price = np.empty(n, dtype=np.float64)
+    out_qty = np.empty(n, dtype=np.float64)
+    out_fee = np.empty(n, dtype=np.float64)
+    out_signal_idx = np.empty(n, dtype=np.int64)
+    values = np.empty(n, dtype=np.float64)
+    
+    (cash, qty, last_price, last_trade_ts, count,
+     buy_signals, sell_signals, *blocked) = _sim_numba._simulate(
+        closes, opens, signals, initial_cash, fee_rate, cooldown_ms,
+        order_ratio, SLIPPAGE, MIN_CASH,
+        out_ts, out_side, out_price, out_qty, out_fee, out_signal_idx, values,
+    )
+    portfolio, trades, ref_values, counts = _reference(
+        closes, opens, signals, initial_cash, fee_rate, cooldown_ms, order_ratio
+    )
+    
+    assert (cash, qty, last_price, last_trade_ts) == (
+        portfolio.cash, portfolio.asset_qty, portfolio.last_price, portfolio.last_trade_ts
+    )
+    assert [buy_signals, sell_signals, *blocked] == counts
+    assert list(zip(out_ts[:count].tolist(), out_side[:count].tolist(),
+                    out_price[:count].tolist(), out_qty[:count].tolist(),
+                    out_fee[:count].tolist(), out_signal_idx[:count].tolist())) == trades
+    np.testing.assert_array_equal(values, ref_values)
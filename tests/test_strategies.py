@@ -0,0 +1,44 @@
+"""Strategy.prepare가 시점별 decide 결과와 같은지 확인한다."""
+
+import numpy as np
+import pytest
+
+from mock_investing.models import PriceBuffer
+from mock_investing.strategies import STRATEGY_SPECS, create_strategy, _SIGNAL_CODES
+
+
+@pytest.mark.parametrize("choice", sorted(STRATEGY_SPECS))
+def test_prepare_matches_decide(choice, prices, backend):
+    signals = create_strategy(choice).prepare(prices)
+    # decide()는 직전 입력을 캐시하므로 새 객체로 시점마다 호출해도 결과는 같아야 한다
+    strategy = create_strategy(choice)
+    expected = np.array(
+        [_SIGNAL_CODES[strategy.decide(prices[:i + 1])] for i in range(len(prices))],
+        dtype=np.int8,
+    )
+    
+    assert signals.dtype == np.int8
+    np.testing.assert_array_equal(signals, expected)
+
+
+
+@pytest.mark.parametrize("choice", sorted(STRATEGY_SPECS))
+def test_decide_with_price_buffer(choice, backend):
+    rng = np.random.default_rng(7)
+    prices = np.round(100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.02, 60))), 2)
+    strategy = create_strategy(choice)
+    buffer = PriceBuffer(capacity=4)
+    
+    # 같은 버퍼에 가격을 추가할 때마다 새로 계산하고, 추가가 없으면 같은 결과를 돌려준다
+    for i, price in enumerate(prices):
+        buffer.append(price)
+        expected = create_strategy(choice).decide(prices[:i + 1])
+        assert strategy.decide(buffer) == expected
+        assert strategy.decide(buffer) == expected
+
+
+def test_decide_does_not_reuse_results_across_arrays():
+    strategy = create_strategy("1", {"fast_period": 2, "slow_period": 3})
+    
+    assert strategy.decide([10, 10, 10, 1, 100]) == "BUY"
+    assert strategy.decide([10, 100, 100, 100, 100]) == "KEEP"
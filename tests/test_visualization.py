@@ -0,0 +1,34 @@
+"""차트 함수가 표시 후 Figure를 닫는지 확인한다 (Agg 백엔드, 창 없음)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+
+from mock_investing import visualization  # noqa: E402
+from mock_investing.models import Side, Trade  # noqa: E402
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    close = np.linspace(100.0, 130.0, 30)
+    return pd.DataFrame(
+        {"Open": close - 1, "Close": close, "High": close + 2, "Low": close - 2},
+        index=pd.date_range("2024-01-01", periods=30),
+    )
+
+
+@pytest.mark.filterwarnings("ignore")
+def test_charts_close_their_figures(df):
+    trades = [Trade(3, Side.BUY, 101.0, 1.0, 0.1, "r"), Trade(10, Side.SELL, 110.0, 1.0, 0.1, "r")]
+    plt.close("all")
+    
+    for _ in range(2):
+        visualization.plot_candlestick_chart(df, "TEST", trades)
+        visualization.plot_backtest_results(df, trades, df["Close"].to_numpy() * 10, "SMA", "TEST", 1000.0)
+        visualization.plot_simple_chart(df, "TEST")
+    
+    assert plt.get_fignums() == []